@@ -1,9 +1,16 @@
 import itertools
-from typing import Set, Generator, List, Optional, Dict, Any
+import functools
+import contextlib
+from typing import Set, FrozenSet, Generator, List, Optional, Dict, Any, Iterable, Tuple, Callable
+import multiprocessing
 import time
 import os
 import sys
 
+from .patterns import BasicPatternGenerator, AdvancedPatternGenerator
+from .optimizations import BloomFilter, TrieDeduplicator, MARISA_AVAILABLE
+from .stream_writer import StreamingFileWriter
+
 # Try to import psutil, but provide fallback if not available
 try:
     import psutil
@@ -16,28 +23,57 @@ except ImportError:
 class PerformanceMonitor:
     """Monitor system performance during generation (with fallbacks)"""
     
-    @staticmethod
-    def get_memory_usage() -> float:
+    # Cached process handle and throttled CPU reading (shared by all callers)
+    _process = None
+    _last_cpu_time = 0.0
+    _last_cpu_value = 0.0
+    CPU_SAMPLE_INTERVAL = 0.5  # seconds
+    
+    @classmethod
+    def _get_process(cls):
+        """Get the psutil handle for this process, re-created after a fork"""
+        if cls._process is None or cls._process.pid != os.getpid():
+            cls._process = psutil.Process()
+        return cls._process
+    
+    @classmethod
+    def oneshot(cls):
+        """Context manager that batches psutil reads of this process"""
+        if not PSUTIL_AVAILABLE:
+            return contextlib.nullcontext()
+        
+        try:
+            return cls._get_process().oneshot()
+        except:
+            return contextlib.nullcontext()
+    
+    @classmethod
+    def get_memory_usage(cls) -> float:
         """Get current memory usage in MB"""
         if not PSUTIL_AVAILABLE:
             return 0.0  # Fallback value
             
         try:
-            process = psutil.Process()
-            return process.memory_info().rss / 1024 / 1024  # MB
+            return cls._get_process().memory_info().rss / 1024 / 1024  # MB
         except:
             return 0.0
     
-    @staticmethod
-    def get_cpu_usage() -> float:
-        """Get current CPU usage percentage"""
+    @classmethod
+    def get_cpu_usage(cls) -> float:
+        """Get current CPU usage percentage (non-blocking, sampled at most every 0.5s)"""
         if not PSUTIL_AVAILABLE:
             return 0.0  # Fallback value
+        
+        now = time.time()
+        if now - cls._last_cpu_time < cls.CPU_SAMPLE_INTERVAL:
+            return cls._last_cpu_value
             
         try:
-            return psutil.cpu_percent(interval=0.1)
+            cls._last_cpu_value = psutil.cpu_percent(interval=None)
         except:
-            return 0.0
+            cls._last_cpu_value = 0.0
+        cls._last_cpu_time = now
+        return cls._last_cpu_value
     
     @staticmethod
     def should_continue(max_memory_mb: int = 500) -> bool:
@@ -76,6 +112,59 @@ class PerformanceMonitor:
                 "psutil_available": False
             }
 
+@functools.lru_cache(maxsize=512)
+def _smart_name_combinations(first_name: str, last_name: str, middle_name: Optional[str],
+                             min_length: int, max_length: int) -> FrozenSet[str]:
+    """Generate smart name combinations without explosion (memoized per name/length set)"""
+    combinations = set()
+
+    # Core individual names
+    names = []
+    if first_name:
+        names.append(first_name)
+    if last_name:
+        names.append(last_name)
+    if middle_name:
+        names.append(middle_name)
+
+    # Add individual names with basic variations
+    for name in names:
+        combinations.add(name)
+        combinations.add(name.upper())
+        combinations.add(name.capitalize())
+
+    # Essential combinations (limit to avoid explosion)
+    if first_name and last_name:
+        # Main combinations
+        main_combos = [
+            first_name + last_name,
+            last_name + first_name,
+            first_name + '_' + last_name,
+            first_name + '.' + last_name,
+            first_name + '-' + last_name,
+            first_name[0] + last_name,
+            first_name + last_name[0],
+            first_name[0] + last_name[0],
+            first_name + '123',
+            last_name + '123',
+            'admin' + last_name,
+            first_name + 'admin'
+        ]
+        combinations.update(main_combos)
+
+    # Middle name combinations (limited)
+    if middle_name:
+        limited_middle_combos = [
+            first_name + middle_name[0] + last_name,
+            first_name[0] + middle_name[0] + last_name[0],
+            middle_name + last_name,
+            first_name + middle_name
+        ]
+        combinations.update(limited_middle_combos)
+
+    # Filter by length and return
+    return frozenset(word for word in combinations if min_length <= len(word) <= max_length)
+
 class BaseWordlistGenerator:
     """Base class with common functionality and performance tracking"""
     
@@ -109,64 +198,34 @@ class BaseWordlistGenerator:
             "psutil_available": PSUTIL_AVAILABLE
         }
         
-        # Initialize base words
-        self.base_words = self._generate_smart_name_combinations()
+        # CPU average as an exponential moving average (no sample history kept)
+        self._cpu_ema = None
+        self._cpu_alpha = 0.2
+        
+        # Adaptive performance sampling: sample every N candidates, where N
+        # grows until sampling costs under 1% of generation time
+        self._sample_every = 1024
+        self._last_sample_time = 0.0
+        
+        # Resource verdict, refreshed only when performance is sampled
+        self._continue_flag = True
+        
+        # Initialize base words, ordered by length so same-sized strings are
+        # expanded together (plain lowercase forms first, then text, for a
+        # reproducible order)
+        self.base_words = sorted(self._generate_smart_name_combinations(),
+                                 key=lambda word: (len(word), not word.islower(), word))
     
-    def _generate_smart_name_combinations(self) -> Set[str]:
+    def _generate_smart_name_combinations(self) -> FrozenSet[str]:
         """Generate smart name combinations without explosion"""
-        combinations = set()
-        
-        # Core individual names
-        names = []
-        if self.first_name:
-            names.append(self.first_name)
-        if self.last_name:
-            names.append(self.last_name)
-        if self.middle_name:
-            names.append(self.middle_name)
-        
-        # Add individual names with basic variations
-        for name in names:
-            combinations.add(name)
-            combinations.add(name.upper())
-            combinations.add(name.capitalize())
-        
-        # Essential combinations (limit to avoid explosion)
-        if self.first_name and self.last_name:
-            # Main combinations
-            main_combos = [
-                self.first_name + self.last_name,
-                self.last_name + self.first_name,
-                self.first_name + '_' + self.last_name,
-                self.first_name + '.' + self.last_name,
-                self.first_name + '-' + self.last_name,
-                self.first_name[0] + self.last_name,
-                self.first_name + self.last_name[0],
-                self.first_name[0] + self.last_name[0],
-                self.first_name + '123',
-                self.last_name + '123',
-                'admin' + self.last_name,
-                self.first_name + 'admin'
-            ]
-            combinations.update(main_combos)
-        
-        # Middle name combinations (limited)
-        if self.middle_name:
-            limited_middle_combos = [
-                self.first_name + self.middle_name[0] + self.last_name,
-                self.first_name[0] + self.middle_name[0] + self.last_name[0],
-                self.middle_name + self.last_name,
-                self.first_name + self.middle_name
-            ]
-            combinations.update(limited_middle_combos)
-        
-        # Filter by length and return
-        return {word for word in combinations if self.min_length <= len(word) <= self.max_length}
+        return _smart_name_combinations(self.first_name, self.last_name, self.middle_name,
+                                        self.min_length, self.max_length)
     
     def _update_performance_stats(self):
         """Update performance statistics"""
-        current_memory = PerformanceMonitor.get_memory_usage()
-        current_cpu = PerformanceMonitor.get_cpu_usage()
+        with PerformanceMonitor.oneshot():
+            current_memory = PerformanceMonitor.get_memory_usage()
+            current_cpu = PerformanceMonitor.get_cpu_usage()
         
         # Update peak memory (only if psutil is available)
         if PSUTIL_AVAILABLE:
@@ -175,13 +234,12 @@ class BaseWordlistGenerator:
                 current_memory
             )
             
-            # Update average CPU (simple moving average)
-            cpu_samples = self.performance_stats.get("_cpu_samples", [])
-            cpu_samples.append(current_cpu)
-            if len(cpu_samples) > 10:  # Keep last 10 samples
-                cpu_samples.pop(0)
-            self.performance_stats["_cpu_samples"] = cpu_samples
-            self.performance_stats["average_cpu_percent"] = sum(cpu_samples) / len(cpu_samples)
+            # Update average CPU (exponential moving average, seeded by the first sample)
+            if self._cpu_ema is None:
+                self._cpu_ema = current_cpu
+            else:
+                self._cpu_ema = self._cpu_alpha * current_cpu + (1 - self._cpu_alpha) * self._cpu_ema
+            self.performance_stats["average_cpu_percent"] = self._cpu_ema
         
         # Update processing time (always available)
         if self.start_time:
@@ -191,6 +249,43 @@ class BaseWordlistGenerator:
                 if self.performance_stats["total_processing_time"] > 0 else 0
             )
     
+    def _sample_performance(self):
+        """Update performance stats and adapt the sampling period to their cost"""
+        sample_start = time.perf_counter()
+        self._update_performance_stats()
+        self._continue_flag = self._should_continue_generation()
+        sample_end = time.perf_counter()
+        
+        period = sample_start - self._last_sample_time
+        self._last_sample_time = sample_end
+        if period > 0:
+            overhead = (sample_end - sample_start) / period
+            if overhead > 0.01:
+                self._sample_every = min(self._sample_every * 2, 65536)
+            elif overhead < 0.001:
+                self._sample_every = max(self._sample_every // 2, 64)
+    
+    def generate_batches(self, batch_size: int = 4096, callback=None,
+                         callback_every: int = 1) -> Generator[List[str], None, None]:
+        """Generate words in lists of up to batch_size, so consumers work per batch"""
+        words = self.generate_with_callback(callback, callback_every)
+        while True:
+            batch = list(itertools.islice(words, batch_size))
+            if not batch:
+                return
+            yield batch
+    
+    def generate_to_file(self, path: str, callback=None, buffer_size: int = 1 << 20,
+                         callback_every: int = 1) -> int:
+        """Write generated words straight to a file as UTF-8 lines; returns the word count"""
+        # The writer's background thread does the write syscalls, so generation
+        # keeps running while the previous chunk is drained to disk
+        with StreamingFileWriter(path, buffer_size) as writer:
+            for batch in self.generate_batches(4096, callback, callback_every):
+                writer.add_words(batch)
+        
+        return writer.word_count
+    
     def get_statistics(self) -> Dict[str, Any]:
         """Get comprehensive generation statistics"""
         base_stats = {
@@ -287,217 +382,276 @@ class BasicWordlistGenerator(BaseWordlistGenerator):
     
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        from .patterns import BasicPatternGenerator
         self.pattern_generator = BasicPatternGenerator()
+        self._flags = (self.enable_capitals, self.enable_leet, self.append_numbers,
+                       self.prepend_numbers, self.special_chars)
+        # Cached per instance, so the variation tuples are released with the generator
+        self._variation_fn = functools.lru_cache(maxsize=1024)(_compile_variation_fn(self._flags))
     
-    def generate_with_callback(self, callback=None) -> Generator[str, None, None]:
+    def generate_with_callback(self, callback=None, callback_every: int = 1) -> Generator[str, None, None]:
         """Generate words efficiently with performance tracking"""
         self.start_time = time.time()
         self.generated_count = 0
         self.duplicate_count = 0
         seen_words = set()
+        seen_add = seen_words.add
+        min_length, max_length = self.min_length, self.max_length
+        
+        # With callback_every > 1 words reach the callback as lists of that size
+        batch = [] if callback and callback_every > 1 else None
         
         # Performance monitoring setup
-        last_performance_update = time.time()
+        self._last_sample_time = time.perf_counter()
+        self._continue_flag = True
+        processed = 0
+        next_sample = self._sample_every
         
         for word in self.base_words:
             # Check system resources periodically
-            if time.time() - last_performance_update > 0.5:  # Update every 0.5 seconds
-                self._update_performance_stats()
-                last_performance_update = time.time()
+            if processed >= next_sample:
+                self._sample_performance()
+                next_sample = processed + self._sample_every
                 
-                if not self._should_continue_generation():
+                if not self._continue_flag:
                     if callback:
-                        callback("[SYSTEM] Generation stopped due to high memory usage", 
+                        callback({"type": "system", "event": "stopped", "reason": "memory"},
                                self.generated_count, self.duplicate_count)
                     break
             
             # Generate variations in a controlled way
-            for variant in self._generate_efficient_variations(word):
-                if not self._should_continue_generation():
-                    break
-                    
-                if (variant not in seen_words and 
-                    self.min_length <= len(variant) <= self.max_length):
-                    
-                    seen_words.add(variant)
+            for variant in self._variation_fn(word):
+                processed += 1
+                
+                if min_length <= len(variant) <= max_length and variant not in seen_words:
+                    seen_add(variant)
                     self.generated_count += 1
                     self.performance_stats["variations_processed"] += 1
                     
-                    if callback:
+                    if batch is not None:
+                        batch.append(variant)
+                        if len(batch) >= callback_every:
+                            callback(batch, self.generated_count, self.duplicate_count)
+                            batch = []
+                    elif callback:
                         callback(variant, self.generated_count, self.duplicate_count)
                     yield variant
                 else:
                     self.duplicate_count += 1
         
+        if batch:
+            callback(batch, self.generated_count, self.duplicate_count)
+        
         # Final performance update
         self._update_performance_stats()
     
     def _generate_efficient_variations(self, word: str) -> Generator[str, None, None]:
         """Generate variations without combinatorial explosion"""
-        # Original word
-        yield word
-        
-        # Capitalization
-        if self.enable_capitals:
-            yield word.upper()
-            yield word.capitalize()
-            if len(word) > 3:
-                yield word[0].upper() + word[1:].lower()
-        
-        # Leet speak (limited)
-        if self.enable_leet:
-            yield from self.pattern_generator.smart_leet_transform(word)
-        
-        # Numbers (limited combinations)
-        if self.append_numbers:
-            yield from self.pattern_generator.smart_number_append(word)
-        
-        if self.prepend_numbers:
-            yield from self.pattern_generator.smart_number_prepend(word)
-        
-        # Special chars
-        if self.special_chars:
-            yield from self.pattern_generator.smart_special_chars(word)
-        
-        # Limited combined patterns (leet + numbers)
-        if self.enable_leet and self.append_numbers:
-            leet_variants = list(self.pattern_generator.smart_leet_transform(word))
-            for leet_word in leet_variants[:3]:  # Limit to first 3 leet variants
-                for num_word in self.pattern_generator.smart_number_append(leet_word):
-                    yield num_word
+        yield from self._variation_fn(word)
+
+@functools.lru_cache(maxsize=32)
+def _compile_variation_fn(flags: Tuple[bool, ...]) -> Callable[[str], Tuple[str, ...]]:
+    """Build the Basic mode variation function for one set of pattern flags"""
+    pattern_generator = BasicPatternGenerator()
+    enable_capitals, enable_leet, append_numbers, prepend_numbers, special_chars = flags
+    
+    def capitalizations(word):
+        if len(word) > 3:
+            return (word.upper(), word.capitalize(), word[0].upper() + word[1:].lower())
+        return (word.upper(), word.capitalize())
+    
+    def leet_with_numbers(word):
+        # Limited combined patterns (leet + numbers): first 3 leet variants only
+        for leet_word in itertools.islice(pattern_generator.smart_leet_transform(word), 3):
+            yield from pattern_generator.smart_number_append(leet_word)
+    
+    # Only the enabled steps are kept, in the original pattern order; the
+    # leet/number/special patterns run as one fused pass
+    steps = []
+    if enable_capitals:
+        steps.append(capitalizations)
+    if enable_leet or append_numbers or prepend_numbers or special_chars:
+        steps.append(functools.partial(pattern_generator.generate_all, leet=enable_leet,
+                                       append_numbers=append_numbers,
+                                       prepend_numbers=prepend_numbers,
+                                       special_chars=special_chars))
+    if enable_leet and append_numbers:
+        steps.append(leet_with_numbers)
+    steps = tuple(steps)
+    
+    def variation_fn(word: str) -> Tuple[str, ...]:
+        variations = [word]
+        for step in steps:
+            variations.extend(step(word))
+        return tuple(variations)
+    
+    return variation_fn
 
 class AdvancedWordlistGenerator(BaseWordlistGenerator):
     """Optimized Advanced Mode - Comprehensive but with safeguards"""
     
-    def __init__(self, **kwargs):
+    def __init__(self, workers: Optional[int] = None, **kwargs):
         super().__init__(**kwargs)
-        from .patterns import AdvancedPatternGenerator
-        from .optimizations import BloomFilter
-        
         self.pattern_generator = AdvancedPatternGenerator()
-        # Smaller bloom filter for performance
-        self.bloom_filter = BloomFilter(expected_items=1000000, false_positive_rate=0.01)
+        # Exact, prefix-sharing dedup when marisa-trie is installed,
+        # otherwise a Bloom filter (small, but with rare false positives)
+        if MARISA_AVAILABLE:
+            self.dedup_filter = TrieDeduplicator()
+        else:
+            self.dedup_filter = BloomFilter(expected_items=1000000, false_positive_rate=0.01)
         self.max_variations_per_word = 500  # Safety limit per base word
-        self._current_word_variations = 0
-    
-    def generate_with_callback(self, callback=None) -> Generator[str, None, None]:
+        
+        # Optional process pool for expanding base words in parallel
+        # (None/0/1 keeps the sequential path)
+        self.workers = workers
+        self._generator_kwargs = kwargs
+    
+    def _iter_expansions(self) -> Generator[Tuple[str, Iterable[str]], None, None]:
+        """Yield (base word, variants) pairs, expanding in worker processes if enabled"""
+        if not self.workers or self.workers <= 1 or len(self.base_words) <= 1:
+            for word in self.base_words:
+                yield word, self._generate_optimized_variations(word)
+            return
+        
+        # Results come back in base word order: deduplication depends on that
+        # order, so parallel output stays identical to the sequential path
+        with multiprocessing.Pool(self.workers, initializer=_init_expansion_worker,
+                                  initargs=(self._generator_kwargs,)) as pool:
+            yield from pool.imap(_expand_one_word, self.base_words, chunksize=8)
+    
+    def generate_with_callback(self, callback=None, callback_every: int = 1) -> Generator[str, None, None]:
         """Generate comprehensive variations with performance safeguards"""
         self.start_time = time.time()
         self.generated_count = 0
         self.duplicate_count = 0
         
         # Performance monitoring setup
-        last_performance_update = time.time()
+        self._last_sample_time = time.perf_counter()
+        self._continue_flag = True
+        processed = 0
         system_info_updates = 0
+        min_length, max_length = self.min_length, self.max_length
         
-        for word in self.base_words:
-            if not self._should_continue_generation():
+        # With callback_every > 1 words reach the callback as lists of that size
+        batch = [] if callback and callback_every > 1 else None
+        
+        for word, variants in self._iter_expansions():
+            if not self._continue_flag:
                 if callback:
-                    callback("[SYSTEM] Generation stopped due to resource limits", 
+                    callback({"type": "system", "event": "stopped", "reason": "resource_limits"},
                            self.generated_count, self.duplicate_count)
                 break
             
-            self._current_word_variations = 0
-            variation_count = 0
-            
-            for variant in self._generate_optimized_variations(word):
-                if not self._should_continue_generation():
+            for variant in variants:
+                if not self._continue_flag:
                     break
                     
                 # Update performance stats periodically
-                if time.time() - last_performance_update > 0.3:  # Update every 0.3 seconds
-                    self._update_performance_stats()
-                    last_performance_update = time.time()
+                processed += 1
+                if not processed & (self._sample_every - 1):
+                    self._sample_performance()
                     system_info_updates += 1
                     
                     # Send system info update occasionally
                     if system_info_updates % 5 == 0 and callback and PSUTIL_AVAILABLE:
                         system_info = PerformanceMonitor.get_system_info()
-                        callback(f"[SYSTEM] Memory: {system_info['memory_usage_mb']:.1f}MB, CPU: {system_info['cpu_usage_percent']:.1f}%", 
+                        callback({"type": "system", "event": "resources",
+                                  "memory_mb": system_info['memory_usage_mb'],
+                                  "cpu_percent": system_info['cpu_usage_percent']},
                                self.generated_count, self.duplicate_count)
                     elif system_info_updates % 10 == 0 and callback:
                         # Basic progress update without system info
-                        callback(f"[SYSTEM] Progress: {self.generated_count} words generated", 
+                        callback({"type": "system", "event": "progress"},
                                self.generated_count, self.duplicate_count)
                 
-                if variation_count >= self.max_variations_per_word:
-                    if callback:
-                        callback(f"[SYSTEM] Limited variations for: {word}", 
-                               self.generated_count, self.duplicate_count)
-                    break
-                    
-                if (self.min_length <= len(variant) <= self.max_length and 
-                    not self.bloom_filter.contains(variant)):
+                if (min_length <= len(variant) <= max_length and 
+                    self.dedup_filter.add_if_new(variant)):
                     
-                    self.bloom_filter.add(variant)
                     self.generated_count += 1
-                    variation_count += 1
                     self.performance_stats["variations_processed"] += 1
                     
-                    if callback:
+                    if batch is not None:
+                        batch.append(variant)
+                        if len(batch) >= callback_every:
+                            callback(batch, self.generated_count, self.duplicate_count)
+                            batch = []
+                    elif callback:
                         callback(variant, self.generated_count, self.duplicate_count)
                     yield variant
                 else:
                     self.duplicate_count += 1
         
+        if batch:
+            callback(batch, self.generated_count, self.duplicate_count)
+        
         # Final performance update
         self._update_performance_stats()
         
         # Send completion message
         if callback:
-            insights = self.get_performance_insights()
-            if PSUTIL_AVAILABLE:
-                callback(f"[SYSTEM] Generation complete. Efficiency: {self._calculate_efficiency_score()}%", 
-                       self.generated_count, self.duplicate_count)
-            else:
-                callback(f"[SYSTEM] Generation complete. {self.generated_count} words generated", 
-                       self.generated_count, self.duplicate_count)
+            efficiency = self._calculate_efficiency_score() if PSUTIL_AVAILABLE else None
+            callback({"type": "system", "event": "complete", "efficiency": efficiency},
+                   self.generated_count, self.duplicate_count)
     
     def _generate_optimized_variations(self, word: str) -> Generator[str, None, None]:
-        """Generate optimized variations without memory explosion"""
-        variations = set()
+        """Stream up to max_variations_per_word distinct optimized variations"""
+        candidates = dict.fromkeys(self._iter_candidates(word))  # Drops repeats across phases
+        return itertools.islice(candidates, self.max_variations_per_word)
+    
+    def _iter_candidates(self, word: str) -> Generator[str, None, None]:
+        """All candidate variations for word, possibly repeated, core variants first"""
+        pattern_generator = self.pattern_generator
         
-        # Phase 1: Core variations
-        variations.add(word)
+        # Phase 1: Core variations (kept, since later phases build on them)
+        core_variants = [word]
         
         # Capitalization
         if self.enable_capitals:
-            variations.update(self.pattern_generator.optimized_capitalization(word))
+            core_variants.extend(pattern_generator.optimized_capitalization(word))
         
         # Leet speak with limits
         if self.enable_leet:
-            leet_variants = self.pattern_generator.optimized_leet_transform(word)
+            leet_variants = pattern_generator.optimized_leet_transform(word)
             # Take only first 30 leet variants to avoid explosion
-            variations.update(list(leet_variants)[:30])
-        
-        # Phase 2: Apply numbers to core variations (limited)
-        number_variations = set()
-        if self.append_numbers or self.prepend_numbers:
-            core_variants = list(variations)[:50]  # Limit to first 50 variants
-            for variant in core_variants:
-                if self.append_numbers:
-                    number_variations.update(self.pattern_generator.optimized_number_append(variant))
-                if self.prepend_numbers:
-                    number_variations.update(self.pattern_generator.optimized_number_prepend(variant))
-        
-        variations.update(number_variations)
-        
-        # Phase 3: Apply special chars to core variations (limited)
-        special_variations = set()
-        if self.special_chars:
-            core_variants = list(variations)[:50]  # Limit to first 50 variants
-            for variant in core_variants:
-                special_variations.update(self.pattern_generator.optimized_special_chars(variant))
-        
-        variations.update(special_variations)
-        
-        # Yield all collected variations
-        for variant in variations:
-            if self._current_word_variations >= self.max_variations_per_word:
-                break
-            self._current_word_variations += 1
-            yield variant
+            core_variants.extend(itertools.islice(leet_variants, 30))
+        
+        # Phases 2 and 3: numbers and special chars on the first 50 distinct core
+        # variants (the leet set repeats the word itself), emitted per core
+        # variant so the per-word cap still reaches every pattern type
+        seed_variants = list(itertools.islice(dict.fromkeys(core_variants), 50))
+        number_append = pattern_generator.optimized_number_append if self.append_numbers else None
+        number_prepend = pattern_generator.optimized_number_prepend if self.prepend_numbers else None
+        special_chars = pattern_generator.optimized_special_chars if self.special_chars else None
+        
+        # Number variants that also get special chars (tops the seeds up to 50)
+        extra_special_seeds = []
+        extra_room = 50 - len(seed_variants)
+        
+        yield from core_variants
+        for variant in seed_variants:
+            for number_fn in (number_append, number_prepend):
+                if number_fn:
+                    for number_variant in number_fn(variant):
+                        if len(extra_special_seeds) < extra_room:
+                            extra_special_seeds.append(number_variant)
+                        yield number_variant
+            if special_chars:
+                yield from special_chars(variant)
+        
+        if special_chars:
+            for variant in extra_special_seeds:
+                yield from special_chars(variant)
+
+# Per-process generator used by the expansion pool workers
+_worker_generator = None
+
+def _init_expansion_worker(generator_kwargs: Dict[str, Any]):
+    """Build the worker's own generator once per pool process"""
+    global _worker_generator
+    _worker_generator = AdvancedWordlistGenerator(**generator_kwargs)
+
+def _expand_one_word(word: str) -> Tuple[str, List[str]]:
+    """Expand a single base word inside a worker process"""
+    return word, list(_worker_generator._generate_optimized_variations(word))
 
 class ProgressNotifier:
     """Advanced progress notification system for real-time updates"""
@@ -570,6 +724,28 @@ class ProgressNotifier:
             minutes = (seconds % 3600) / 60
             return f"{hours:.0f}h {minutes:.0f}m"
 
+def format_system_event(event: Dict[str, Any], generated_count: int = 0) -> str:
+    """
+    Format a structured system event from generate_with_callback for display.
+    
+    Generators pass words to the callback as plain strings and system
+    notifications as dicts with "type": "system"; formatting is left to the UI.
+    """
+    kind = event.get("event")
+    if kind == "stopped":
+        if event.get("reason") == "memory":
+            return "[SYSTEM] Generation stopped due to high memory usage"
+        return "[SYSTEM] Generation stopped due to resource limits"
+    if kind == "resources":
+        return f"[SYSTEM] Memory: {event['memory_mb']:.1f}MB, CPU: {event['cpu_percent']:.1f}%"
+    if kind == "progress":
+        return f"[SYSTEM] Progress: {generated_count} words generated"
+    if kind == "complete":
+        if event.get("efficiency") is not None:
+            return f"[SYSTEM] Generation complete. Efficiency: {event['efficiency']}%"
+        return f"[SYSTEM] Generation complete. {generated_count} words generated"
+    return f"[SYSTEM] {kind}"
+
 # Factory function
 def create_generator(mode: str, **kwargs) -> BaseWordlistGenerator:
     """
@@ -587,6 +763,37 @@ def create_generator(mode: str, **kwargs) -> BaseWordlistGenerator:
     else:  # basic
         return BasicWordlistGenerator(**kwargs)
 
+def generate_in_background(params: Dict[str, Any], output_file: str, progress_queue,
+                           stop_event, callback_every: int = 1000, preview_size: int = 10):
+    """
+    Process target: generate a wordlist into output_file and report through progress_queue.
+    
+    Messages are tuples: ("progress", words, count, duplicates), ("event", text),
+    then exactly one of ("done", statistics) or ("error", message). Progress messages
+    carry only the last preview_size words of each batch; the rest are on disk. Setting
+    stop_event ends generation after the current batch, keeping what was written.
+    """
+    try:
+        generator = create_generator(**params)
+        
+        def report(words, count, duplicates):
+            if isinstance(words, dict):  # Structured system event
+                progress_queue.put(("event", format_system_event(words, count)))
+            else:
+                if isinstance(words, str):  # callback_every == 1 reports single words
+                    words = [words]
+                progress_queue.put(("progress", words[-preview_size:], count, duplicates))
+        
+        with StreamingFileWriter(output_file) as writer:
+            for batch in generator.generate_batches(4096, report, callback_every):
+                writer.add_words(batch)
+                if stop_event.is_set():
+                    break
+        
+        progress_queue.put(("done", generator.get_statistics()))
+    except Exception as e:
+        progress_queue.put(("error", str(e)))
+
 def get_generator_capabilities() -> Dict[str, Any]:
     """Get information about generator capabilities and limitations"""
     return {
@@ -608,23 +815,25 @@ def get_generator_capabilities() -> Dict[str, Any]:
             "Memory usage depends on name length and pattern options",
             "Disabling patterns improves speed and reduces memory",
             "Basic mode is recommended for most use cases",
-            "Advanced mode uses Bloom filter for duplicate detection",
+            "Advanced mode uses a MARISA trie (if installed) or a Bloom filter for duplicate detection",
             f"Performance monitoring: {'Enabled' if PSUTIL_AVAILABLE else 'Disabled (install psutil)'}"
         ]
     }
 
 # Performance testing utility (works without psutil)
 def benchmark_generator(generator: BaseWordlistGenerator, sample_size: int = 1000) -> Dict[str, Any]:
-    """Benchmark generator performance with a sample"""
+    """Benchmark generator performance with a sample (speed and memory from one pass)"""
+    with PerformanceMonitor.oneshot():
+        start_memory = PerformanceMonitor.get_memory_usage()
     start_time = time.time()
     
-    words_generated = 0
-    for word in generator.generate_with_callback():
-        words_generated += 1
-        if words_generated >= sample_size:
-            break
+    # islice stops the generator after sample_size words without a Python-level counter
+    for _ in itertools.islice(generator.generate_with_callback(), sample_size):
+        pass
     
     end_time = time.time()
+    with PerformanceMonitor.oneshot():
+        end_memory = PerformanceMonitor.get_memory_usage()
     
     results = {
         "sample_size": sample_size,
@@ -635,25 +844,8 @@ def benchmark_generator(generator: BaseWordlistGenerator, sample_size: int = 100
     
     # Add memory info if psutil is available
     if PSUTIL_AVAILABLE:
-        try:
-            start_memory = PerformanceMonitor.get_memory_usage()
-            # Re-run to measure memory (simplified approach)
-            temp_generator = create_generator(
-                mode=generator.__class__.__name__.lower().replace('wordlistgenerator', ''),
-                first_name="benchmark",
-                last_name="test"
-            )
-            
-            for word in temp_generator.generate_with_callback():
-                if temp_generator.generated_count >= 100:
-                    break
-                    
-            end_memory = PerformanceMonitor.get_memory_usage()
-            results["memory_increase_mb"] = end_memory - start_memory
-            results["efficiency_rating"] = "Excellent" if (end_memory - start_memory) < 10 else "Good"
-        except:
-            results["memory_increase_mb"] = "Measurement failed"
-            results["efficiency_rating"] = "Unknown"
+        results["memory_increase_mb"] = end_memory - start_memory
+        results["efficiency_rating"] = "Excellent" if (end_memory - start_memory) < 10 else "Good"
     else:
         results["memory_increase_mb"] = "Install psutil for memory metrics"
         results["efficiency_rating"] = "Unknown"
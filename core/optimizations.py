@@ -1,42 +1,185 @@
 import hashlib
-from typing import Generator
+import math
+from typing import Tuple
+
+# Try to import xxhash for faster non-cryptographic hashing, fall back to blake2b
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
+
+# Try to import numpy (the numba probe kernels work on a numpy view of the bits)
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# Try to import marisa-trie for compact exact duplicate detection
+try:
+    import marisa_trie
+    MARISA_AVAILABLE = True
+except ImportError:
+    MARISA_AVAILABLE = False
+
+# Try to import numba to compile the Bloom filter probe loops (needs numpy)
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = NUMPY_AVAILABLE
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+if NUMBA_AVAILABLE:
+    # Compiled at import (explicit signatures) and cached on disk; same probe
+    # positions as the pure Python loops in BloomFilter
+    @njit("void(uint8[::1], int64, int64, int64, int64)", cache=True)
+    def _bloom_add(bits, base, g1, g2, k):
+        for i in range(k):
+            pos = base | ((g1 + i * g2) & 511)
+            bits[pos >> 3] |= np.uint8(1 << (pos & 7))
+    
+    @njit("boolean(uint8[::1], int64, int64, int64, int64)", cache=True)
+    def _bloom_contains(bits, base, g1, g2, k):
+        for i in range(k):
+            pos = base | ((g1 + i * g2) & 511)
+            if not bits[pos >> 3] & (1 << (pos & 7)):
+                return False
+        return True
+    
+    @njit("boolean(uint8[::1], int64, int64, int64, int64)", cache=True)
+    def _bloom_add_if_new(bits, base, g1, g2, k):
+        is_new = False
+        for i in range(k):
+            pos = base | ((g1 + i * g2) & 511)
+            bit = np.uint8(1 << (pos & 7))
+            if not bits[pos >> 3] & bit:
+                bits[pos >> 3] |= bit
+                is_new = True
+        return is_new
 
 class BloomFilter:
-    """Space-efficient probabilistic data structure for duplicate detection"""
+    """Space-efficient probabilistic data structure for duplicate detection
+    
+    Blocked layout: all probes for an item fall in one 512-bit block (a 64-byte
+    cache line), so each lookup touches a single cache line.
+    """
+    
+    BLOCK_BITS = 512
     
     def __init__(self, expected_items: int, false_positive_rate: float = 0.01):
-        self.size = self._optimal_size(expected_items, false_positive_rate)
-        self.hash_count = self._optimal_hash_count(expected_items, self.size)
-        self.bit_array = bytearray((self.size + 7) // 8)
+        optimal_size = self._optimal_size(expected_items, false_positive_rate)
+        self.hash_count = self._optimal_hash_count(expected_items, optimal_size)
+        # Round up to a power of two (at least one block) so blocks come from a mask
+        self.size = 1 << max(9, (optimal_size - 1).bit_length())
+        self._block_mask = self.size // self.BLOCK_BITS - 1
+        self.bit_array = bytearray(self.size // 8)
+        # Writable numpy view of bit_array for the compiled probe loops
+        self._bits = np.frombuffer(self.bit_array, dtype=np.uint8) if NUMBA_AVAILABLE else None
     
     def _optimal_size(self, n: int, p: float) -> int:
         """Calculate optimal bit array size"""
-        import math
         return int(-(n * math.log(p)) / (math.log(2) ** 2))
     
     def _optimal_hash_count(self, n: int, m: int) -> int:
         """Calculate optimal number of hash functions"""
-        import math
         return max(1, int((m / n) * math.log(2)))
     
-    def _hashes(self, item: str) -> Generator[int, None, None]:
-        """Generate multiple hash values for an item"""
-        for i in range(self.hash_count):
-            hash_obj = hashlib.md5(f"{item}{i}".encode())
-            yield int(hash_obj.hexdigest(), 16) % self.size
+    def _base_hashes(self, item: str) -> Tuple[int, int]:
+        """Compute the two 64-bit hashes the probe positions are derived from"""
+        data = item.encode('utf-8')
+        if XXHASH_AVAILABLE:
+            digest = xxhash.xxh3_128_intdigest(data)  # One call yields both halves
+            h1 = digest & 0xFFFFFFFFFFFFFFFF
+            h2 = digest >> 64
+        else:
+            digest = hashlib.blake2b(data, digest_size=16).digest()
+            h1 = int.from_bytes(digest[:8], 'little')
+            h2 = int.from_bytes(digest[8:], 'little')
+        return h1, h2 | 1  # Odd step so probes don't collapse onto one bit
+    
+    def _block_hashes(self, item: str) -> Tuple[int, int, int]:
+        """Split the base hashes into a block bit offset and an in-block double-hash pair"""
+        h1, h2 = self._base_hashes(item)
+        return (h1 & self._block_mask) << 9, h2 >> 32, h2 & 0xFFFFFFFF  # h2 is odd
     
     def add(self, item: str):
         """Add item to Bloom filter"""
-        for hash_val in self._hashes(item):
-            byte_index = hash_val // 8
-            bit_index = hash_val % 8
-            self.bit_array[byte_index] |= (1 << bit_index)
+        base, g1, g2 = self._block_hashes(item)
+        if NUMBA_AVAILABLE:
+            _bloom_add(self._bits, base, g1, g2, self.hash_count)
+            return
+        bits = self.bit_array
+        for i in range(self.hash_count):
+            hash_val = base | ((g1 + i * g2) & 511)
+            bits[hash_val >> 3] |= 1 << (hash_val & 7)
     
     def contains(self, item: str) -> bool:
         """Check if item might be in Bloom filter"""
-        for hash_val in self._hashes(item):
-            byte_index = hash_val // 8
-            bit_index = hash_val % 8
-            if not (self.bit_array[byte_index] & (1 << bit_index)):
+        base, g1, g2 = self._block_hashes(item)
+        if NUMBA_AVAILABLE:
+            return _bloom_contains(self._bits, base, g1, g2, self.hash_count)
+        bits = self.bit_array
+        for i in range(self.hash_count):
+            hash_val = base | ((g1 + i * g2) & 511)
+            if not bits[hash_val >> 3] & (1 << (hash_val & 7)):
                 return False
-        return True
\ No newline at end of file
+        return True
+    
+    def add_if_new(self, item: str) -> bool:
+        """Add item and report whether it was new (single hashing pass)"""
+        base, g1, g2 = self._block_hashes(item)
+        if NUMBA_AVAILABLE:
+            return _bloom_add_if_new(self._bits, base, g1, g2, self.hash_count)
+        bits = self.bit_array
+        is_new = False
+        for i in range(self.hash_count):
+            hash_val = base | ((g1 + i * g2) & 511)
+            byte_index = hash_val >> 3
+            bit = 1 << (hash_val & 7)
+            if not bits[byte_index] & bit:
+                bits[byte_index] |= bit
+                is_new = True
+        return is_new
+
+class TrieDeduplicator:
+    """Exact duplicate detection with prefix-sharing MARISA tries (requires marisa-trie)"""
+    
+    def __init__(self, batch_size: int = 10000):
+        if not MARISA_AVAILABLE:
+            raise ImportError("TrieDeduplicator requires marisa-trie (pip install marisa-trie)")
+        
+        self.batch_size = batch_size
+        self._pending = set()
+        # Immutable tries, oldest (largest) first; merged when a newer one catches up
+        self._tries = []
+        self._count = 0
+    
+    def _flush(self):
+        """Freeze pending items into a trie, merging levels to keep lookups logarithmic"""
+        keys = list(self._pending)
+        self._pending.clear()
+        while self._tries and len(self._tries[-1]) <= 2 * len(keys):
+            keys.extend(self._tries.pop().keys())
+        self._tries.append(marisa_trie.Trie(keys))
+    
+    def contains(self, item: str) -> bool:
+        """Check if item has been added"""
+        return item in self._pending or any(item in trie for trie in self._tries)
+    
+    def add(self, item: str):
+        """Add item to the deduplicator"""
+        self.add_if_new(item)
+    
+    def add_if_new(self, item: str) -> bool:
+        """Add item and report whether it was new"""
+        if self.contains(item):
+            return False
+        self._pending.add(item)
+        self._count += 1
+        if len(self._pending) >= self.batch_size:
+            self._flush()
+        return True
+    
+    def __len__(self) -> int:
+        return self._count
@@ -1,6 +1,9 @@
-from typing import Set, Generator
+from typing import Generator, List
 import itertools
 
+# Word separators turned into camel case by the capitalization patterns
+CAMEL_CASE_SEPARATORS = (' ', '-', '_', '.')
+
 class BasicPatternGenerator:
     """Efficient Basic Pattern Generator"""
     
@@ -15,52 +18,96 @@ class BasicPatternGenerator:
         
         self.common_numbers = ['1', '12', '123', '1234', '007', '69', '2024', '2023']
         self.special_chars = ['!', '@', '#', '$']
+        
+        # Affix tables built once so the per-word loops only concatenate
+        self._digits = tuple(str(i) for i in range(10))
+        self._prepend_numbers = tuple(self.common_numbers[:5])  # Only first 5
+        self._prepend_digits = self._digits[:5]  # Only 0-4
+        
+        # Translate tables replacing both cases of a letter, in yield order
+        self._leet_tables = tuple(
+            (original, str.maketrans({original: replacement, original.upper(): replacement}))
+            for original, replacement in [
+                ('a', '4'), ('a', '@'), ('e', '3'), ('i', '1'),
+                ('o', '0'), ('s', '5'), ('s', '$')
+            ]
+        )
     
     def smart_leet_transform(self, word: str) -> Generator[str, None, None]:
         """Smart leet transform without explosion"""
         yield word  # Original
         
         # Single substitution passes (most effective ones)
-        if 'a' in word.lower():
-            yield word.replace('a', '4').replace('A', '4')
-            yield word.replace('a', '@').replace('A', '@')
-        if 'e' in word.lower():
-            yield word.replace('e', '3').replace('E', '3')
-        if 'i' in word.lower():
-            yield word.replace('i', '1').replace('I', '1')
-        if 'o' in word.lower():
-            yield word.replace('o', '0').replace('O', '0')
-        if 's' in word.lower():
-            yield word.replace('s', '5').replace('S', '5')
-            yield word.replace('s', '$').replace('S', '$')
+        lowered = word.lower()
+        for original, table in self._leet_tables:
+            if original in lowered:
+                yield word.translate(table)
     
     def smart_number_append(self, word: str) -> Generator[str, None, None]:
         """Smart number appending"""
+        room = self._get_max_length() - len(word)
         for num in self.common_numbers:
-            if len(word + num) <= self._get_max_length():
+            if len(num) <= room:
                 yield word + num
         
         # Limited single digits
-        for i in range(10):
-            yield word + str(i)
+        for digit in self._digits:
+            yield word + digit
     
     def smart_number_prepend(self, word: str) -> Generator[str, None, None]:
         """Smart number prepending"""
-        for num in self.common_numbers[:5]:  # Only first 5
-            if len(num + word) <= self._get_max_length():
+        room = self._get_max_length() - len(word)
+        for num in self._prepend_numbers:
+            if len(num) <= room:
                 yield num + word
         
-        for i in range(5):  # Only 0-4
-            yield str(i) + word
+        for digit in self._prepend_digits:
+            yield digit + word
     
     def smart_special_chars(self, word: str) -> Generator[str, None, None]:
         """Smart special characters"""
+        room = self._get_max_length() - len(word)
         for char in self.special_chars:
-            if len(char + word) <= self._get_max_length():
+            if len(char) <= room:
                 yield char + word
-            if len(word + char) <= self._get_max_length():
                 yield word + char
     
+    def generate_all(self, word: str, leet: bool = True, append_numbers: bool = True,
+                     prepend_numbers: bool = True, special_chars: bool = True) -> List[str]:
+        """The enabled smart_* variants in one fused pass (same order as calling each in turn)"""
+        variants = []
+        append = variants.append
+        room = self._get_max_length() - len(word)
+        
+        if leet:
+            append(word)
+            lowered = word.lower()
+            for original, table in self._leet_tables:
+                if original in lowered:
+                    append(word.translate(table))
+        
+        if append_numbers:
+            for num in self.common_numbers:
+                if len(num) <= room:
+                    append(word + num)
+            for digit in self._digits:
+                append(word + digit)
+        
+        if prepend_numbers:
+            for num in self._prepend_numbers:
+                if len(num) <= room:
+                    append(num + word)
+            for digit in self._prepend_digits:
+                append(digit + word)
+        
+        if special_chars:
+            for char in self.special_chars:
+                if len(char) <= room:
+                    append(char + word)
+                    append(word + char)
+        
+        return variants
+    
     def _get_max_length(self):
         return 20
 
@@ -80,105 +127,95 @@ class AdvancedPatternGenerator:
         self.special_chars = ['!', '@', '#', '$', '%', '&', '*']
         self.common_numbers = ['1', '12', '123', '1234', '12345', '007', '69', '420', '777']
         self.years = ['2024', '2023', '2022', '2021', '2020']
+        
+        # Affix tables built once so the per-word loops only concatenate.
+        # "Capped" affixes are subject to the 20 character limit.
+        digits = [str(i) for i in range(10)]
+        tens = [str(i) for i in range(10, 100, 10)]  # 10, 20, 30, ..., 90
+        self._append_capped = tuple(self.common_numbers + self.years)
+        self._append_always = tuple(digits + tens)
+        self._prepend_capped = tuple(self.common_numbers[:8] + self.years[:3])  # Limited set, recent years
+        self._prepend_always = tuple(digits)
+        
+        # (prefix, suffix) pairs for special chars, deduplicated once here so
+        # the per-word loop needs no set
+        special_affixes = []
+        for char in self.special_chars:
+            special_affixes += [(char, ''), ('', char)]
+            if char in ['!', '@', '#']:  # Only wrap common ones
+                special_affixes.append((char, char))
+        # Limited combinations
+        for char1 in self.special_chars[:2]:
+            for char2 in self.special_chars[:2]:
+                special_affixes.append((char1, char2))
+        self._special_affixes = tuple(dict.fromkeys(special_affixes))
+        
+        # (letter, replacement, translate table for either case of the letter)
+        self._leet_substitutions = tuple(
+            (original, replacement, str.maketrans({original: replacement, original.upper(): replacement}))
+            for original, replacement in [
+                ('a', '4'), ('a', '@'), ('e', '3'), ('i', '1'),
+                ('i', '!'), ('o', '0'), ('s', '5'), ('s', '$'), ('t', '7')
+            ]
+        )
     
-    def optimized_leet_transform(self, word: str) -> Set[str]:
+    def optimized_leet_transform(self, word: str) -> Generator[str, None, None]:
         """Optimized leet transform with limits"""
-        results = set()
-        results.add(word)
+        yield word
+        seen = {word}  # At most 19 entries, so self-duplicates never reach the caller
+        lowered = word.lower()
         
         # Single pass with common substitutions
-        substitutions = [
-            ('a', '4'), ('a', '@'), ('e', '3'), ('i', '1'),
-            ('i', '!'), ('o', '0'), ('s', '5'), ('s', '$'), ('t', '7')
-        ]
-        
-        for original, replacement in substitutions:
-            if original in word.lower():
-                # Replace all occurrences
-                new_word = word.lower().replace(original, replacement)
-                results.add(new_word)
-                # Also try with original case
-                new_word_mixed = ''
-                for char in word:
-                    if char.lower() == original:
-                        new_word_mixed += replacement
-                    else:
-                        new_word_mixed += char
-                results.add(new_word_mixed)
-        
-        return results
+        for original, replacement, mixed_case_table in self._leet_substitutions:
+            if original in lowered:
+                # Replace all occurrences, then with original case (both cases of the letter replaced)
+                for variant in (lowered.replace(original, replacement), word.translate(mixed_case_table)):
+                    if variant not in seen:
+                        seen.add(variant)
+                        yield variant
     
-    def optimized_capitalization(self, word: str) -> Set[str]:
+    def optimized_capitalization(self, word: str) -> Generator[str, None, None]:
         """Optimized capitalization patterns"""
-        patterns = set()
-        
-        patterns.add(word.upper())
-        patterns.add(word.capitalize())
+        patterns = [word.upper(), word.capitalize()]
         
         if len(word) > 3:
-            patterns.add(word[0].upper() + word[1:].lower())
+            patterns.append(word[0].upper() + word[1:].lower())
         
         # Camel case for separated words
-        for separator in [' ', '-', '_', '.']:
+        for separator in CAMEL_CASE_SEPARATORS:
             if separator in word:
-                parts = word.split(separator)
-                camel_case = parts[0] + ''.join(part.capitalize() for part in parts[1:])
-                patterns.add(camel_case)
+                first, *rest = word.split(separator)
+                patterns.append(first + ''.join([part.capitalize() for part in rest]))
                 break
         
-        return patterns
+        # At most 4 candidates; dict.fromkeys drops repeats in one C call
+        yield from dict.fromkeys(patterns)
     
-    def optimized_number_append(self, word: str) -> Set[str]:
+    def optimized_number_append(self, word: str) -> Generator[str, None, None]:
         """Optimized number appending"""
-        results = set()
-        
-        for num in self.common_numbers:
-            if len(word + num) <= 20:
-                results.add(word + num)
-        
-        for year in self.years:
-            if len(word + year) <= 20:
-                results.add(word + year)
-        
-        # Limited number ranges
-        for i in range(10):
-            results.add(word + str(i))
-        
-        for i in range(10, 100, 10):  # 10, 20, 30, ..., 90
-            results.add(word + str(i))
-        
-        return results
+        room = 20 - len(word)
+        used = set()  # Capped affixes already emitted (some digits are in both tables)
+        for num in self._append_capped:
+            if len(num) <= room:
+                used.add(num)
+                yield word + num
+        for num in self._append_always:
+            if num not in used:
+                yield word + num
     
-    def optimized_number_prepend(self, word: str) -> Set[str]:
+    def optimized_number_prepend(self, word: str) -> Generator[str, None, None]:
         """Optimized number prepending"""
-        results = set()
-        
-        for num in self.common_numbers[:8]:  # Limited set
-            if len(num + word) <= 20:
-                results.add(num + word)
-        
-        for year in self.years[:3]:  # Only recent years
-            if len(year + word) <= 20:
-                results.add(year + word)
-        
-        for i in range(10):
-            results.add(str(i) + word)
-        
-        return results
+        room = 20 - len(word)
+        used = set()  # Capped affixes already emitted (some digits are in both tables)
+        for num in self._prepend_capped:
+            if len(num) <= room:
+                used.add(num)
+                yield num + word
+        for num in self._prepend_always:
+            if num not in used:
+                yield num + word
     
-    def optimized_special_chars(self, word: str) -> Set[str]:
+    def optimized_special_chars(self, word: str) -> Generator[str, None, None]:
         """Optimized special characters"""
-        results = set()
-        
-        for char in self.special_chars:
-            results.add(char + word)
-            results.add(word + char)
-            if char in ['!', '@', '#']:  # Only wrap common ones
-                results.add(char + word + char)
-        
-        # Limited combinations
-        for char1 in self.special_chars[:2]:
-            for char2 in self.special_chars[:2]:
-                results.add(char1 + word + char2)
-        
-        return results
\ No newline at end of file
+        for prefix, suffix in self._special_affixes:
+            yield prefix + word + suffix
@@ -1,6 +1,9 @@
 import os
+import queue
+import threading
 import time
 import sys
+from typing import List
 
 # Try to import psutil, but provide fallback if not available
 try:
@@ -13,15 +16,18 @@ except ImportError:
 class PerformanceMonitor:
     """Performance monitoring with fallbacks for stream writer"""
     
-    @staticmethod
-    def get_memory_usage() -> float:
+    _process = None  # Cached process handle
+    
+    @classmethod
+    def get_memory_usage(cls) -> float:
         """Get current memory usage in MB"""
         if not PSUTIL_AVAILABLE:
             return 0.0
             
         try:
-            process = psutil.Process()
-            return process.memory_info().rss / 1024 / 1024  # MB
+            if cls._process is None or cls._process.pid != os.getpid():
+                cls._process = psutil.Process()
+            return cls._process.memory_info().rss / 1024 / 1024  # MB
         except:
             return 0.0
     
@@ -33,59 +39,130 @@ class PerformanceMonitor:
             
         return PerformanceMonitor.get_memory_usage() < max_memory_mb
 
+def _ensure_directory(output_file: str):
+    """Create the parent directory of output_file (no-op for bare filenames)"""
+    directory = os.path.dirname(output_file)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
 class StreamingFileWriter:
     """Write words directly to file without storing in memory"""
     
-    def __init__(self, output_file: str, buffer_size: int = 1000):
+    def __init__(self, output_file: str, buffer_size: int = 1 << 20):
         self.output_file = output_file
-        self.buffer_size = buffer_size
-        self.buffer = []
+        self.partial_file = output_file + '.partial'  # Renamed to output_file once complete
+        self.buffer_size = buffer_size  # Bytes buffered before each write
+        self.buffer = bytearray()
         self.word_count = 0
-        self.file_obj = None
-        self.start_time = time.time()
+        self.fd = None
+        
+        # Background writer: full buffers are handed over through a bounded
+        # queue so generation keeps running while the previous chunk is written
+        self._queue = None
+        self._writer = None
+        self._writer_error = None
+        self.start_time = time.monotonic_ns()  # Integer clock; only read again in stats
         
         # Performance tracking (with fallbacks)
         self.peak_memory = 0
-        self.total_words_processed = 0
         self.psutil_available = PSUTIL_AVAILABLE
         
         # Ensure directory exists
-        os.makedirs(os.path.dirname(output_file), exist_ok=True)
+        _ensure_directory(output_file)
     
     def __enter__(self):
-        self.file_obj = open(self.output_file, 'w', encoding='utf-8', buffering=8192)
+        # Raw descriptor: lines are encoded once and written without a text layer
+        flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+        self.fd = os.open(self.partial_file, flags, 0o644)
+        self._queue = queue.Queue(maxsize=8)  # Backpressure: at most 8 chunks in flight
+        self._writer_error = None
+        self._writer = threading.Thread(target=self._writer_loop, name="wordlist-writer", daemon=True)
+        self._writer.start()
         return self
     
+    def _writer_loop(self):
+        """Write queued chunks until the None sentinel (runs on the writer thread)"""
+        while True:
+            chunk = self._queue.get()
+            if chunk is None:
+                return
+            if self._writer_error is None:  # After a failure keep draining so put() never blocks
+                try:
+                    written = 0
+                    with memoryview(chunk) as view:
+                        while written < len(view):  # os.write may be partial
+                            written += os.write(self.fd, view[written:])
+                except BaseException as e:
+                    self._writer_error = e
+    
+    @property
+    def total_words_processed(self) -> int:
+        """Words added so far (same as word_count)"""
+        return self.word_count
+    
     def add_word(self, word: str):
         """Add word to buffer, flush when full"""
-        self.buffer.append(word + '\n')
+        buffer = self.buffer
+        buffer += word.encode('utf-8')
+        buffer += b'\n'
         self.word_count += 1
-        self.total_words_processed += 1
         
-        # Update peak memory usage (only if psutil available)
-        if PSUTIL_AVAILABLE:
-            current_memory = PerformanceMonitor.get_memory_usage()
-            self.peak_memory = max(self.peak_memory, current_memory)
+        # Flush buffer when full (memory is sampled per flush, not per word)
+        if len(buffer) >= self.buffer_size:
+            self._flush_buffer()
+    
+    def add_words(self, words: List[str]):
+        """Add a batch of words with a single join and encode, flush when full"""
+        if not words:
+            return
+        buffer = self.buffer
+        buffer += '\n'.join(words).encode('utf-8')
+        buffer += b'\n'
+        self.word_count += len(words)
         
-        # Flush buffer when full or memory getting high (if we can monitor it)
-        if (len(self.buffer) >= self.buffer_size or 
-            (PSUTIL_AVAILABLE and PerformanceMonitor.get_memory_usage() > 400)):
+        if len(buffer) >= self.buffer_size:
             self._flush_buffer()
     
     def _flush_buffer(self):
         """Write buffer to file and clear"""
+        # Update peak memory usage while the buffer is at its fullest
+        if PSUTIL_AVAILABLE:
+            self.peak_memory = max(self.peak_memory, PerformanceMonitor.get_memory_usage())
+        
+        if self._writer_error is not None:
+            raise self._writer_error
+        
         if self.buffer:
-            self.file_obj.writelines(self.buffer)
-            self.buffer.clear()
+            # Hand the filled buffer to the writer thread and start a new one (no copy)
+            chunk, self.buffer = self.buffer, bytearray()
+            self._queue.put(chunk)
     
     def __exit__(self, exc_type, exc_val, exc_tb):
-        self._flush_buffer()
-        if self.file_obj:
-            self.file_obj.close()
+        if self.fd is not None:
+            completed = False
+            try:
+                self._flush_buffer()
+            finally:
+                self._queue.put(None)
+                self._writer.join()
+                try:
+                    if exc_type is None and self._writer_error is None:
+                        os.fsync(self.fd)
+                        completed = True
+                finally:
+                    os.close(self.fd)
+                    self.fd = None
+                    # Only a fully written file is published; a failed run leaves nothing behind
+                    if completed:
+                        os.replace(self.partial_file, self.output_file)
+                    else:
+                        os.unlink(self.partial_file)
+            if self._writer_error is not None:
+                raise self._writer_error
     
     def get_stats(self):
         """Get writing statistics"""
-        elapsed = time.time() - self.start_time
+        elapsed = (time.monotonic_ns() - self.start_time) / 1e9
         stats = {
             "word_count": self.word_count,
             "total_processing_time": elapsed,
@@ -110,38 +187,50 @@ class OptimizedStreamingFileWriter:
         self.buffer = []
         self.word_count = 0
         self.file_obj = None
-        self.start_time = time.time()
+        self.start_time = time.monotonic_ns()  # Integer clock; only read again in stats
         
         # Performance tracking
         self.peak_memory = 0
-        self.total_words_processed = 0
         self.flush_count = 0
         self.psutil_available = PSUTIL_AVAILABLE
         
         # Ensure directory exists
-        os.makedirs(os.path.dirname(output_file), exist_ok=True)
+        _ensure_directory(output_file)
     
     def __enter__(self):
         self.file_obj = open(self.output_file, 'w', encoding='utf-8', buffering=8192)
         return self
     
+    @property
+    def total_words_processed(self) -> int:
+        """Words added so far (same as word_count)"""
+        return self.word_count
+    
     def add_word(self, word: str):
         """Add word to buffer with performance checks"""
-        self.buffer.append(word + '\n')
+        buffer = self.buffer
+        buffer.append(word + '\n')
         self.word_count += 1
-        self.total_words_processed += 1
         
-        # Update peak memory usage if psutil available
-        if PSUTIL_AVAILABLE:
-            current_memory = PerformanceMonitor.get_memory_usage()
-            self.peak_memory = max(self.peak_memory, current_memory)
+        # Flush buffer when full (memory is sampled per flush, not per word)
+        if len(buffer) >= self.buffer_size:
+            self._flush_buffer()
+    
+    def add_words(self, words: List[str]):
+        """Add a batch of words, flush when full"""
+        buffer = self.buffer
+        buffer.extend([word + '\n' for word in words])
+        self.word_count += len(words)
         
-        # Flush buffer when full
-        if len(self.buffer) >= self.buffer_size:
+        if len(buffer) >= self.buffer_size:
             self._flush_buffer()
     
     def _flush_buffer(self):
         """Write buffer to file and clear"""
+        # Update peak memory usage while the buffer is at its fullest
+        if PSUTIL_AVAILABLE:
+            self.peak_memory = max(self.peak_memory, PerformanceMonitor.get_memory_usage())
+        
         if self.buffer:
             self.file_obj.writelines(self.buffer)
             self.buffer.clear()
@@ -154,7 +243,7 @@ class OptimizedStreamingFileWriter:
     
     def get_performance_stats(self):
         """Get comprehensive performance statistics"""
-        elapsed = time.time() - self.start_time
+        elapsed = (time.monotonic_ns() - self.start_time) / 1e9
         stats = {
             "word_count": self.word_count,
             "peak_memory_mb": self.peak_memory if PSUTIL_AVAILABLE else "N/A",
@@ -1,15 +1,17 @@
 import streamlit as st
+import io
+import multiprocessing
 import os
+import queue
 import time
-import pandas as pd
 from datetime import datetime
-import sys
-from collections import Counter
+from collections import Counter, deque
+from operator import itemgetter
 import base64
 
-# Import our generators
-from core.generator import create_generator
-from core.stream_writer import StreamingFileWriter
+# st.download_button holds the whole file in server memory, so larger
+# wordlists are left on disk instead of being offered for download
+MAX_DOWNLOAD_BYTES = 200 * 1024 * 1024
 
 # Page configuration
 st.set_page_config(
@@ -19,429 +21,14 @@ st.set_page_config(
     initial_sidebar_state="collapsed"
 )
 
+@st.cache_resource
+def load_theme_css() -> str:
+    """Read the theme stylesheet once per server process"""
+    with open(os.path.join(os.path.dirname(os.path.abspath(__file__)), "theme.css"), encoding="utf-8") as f:
+        return f.read()
+
 # Matrix Green Terminal Theme CSS
-st.markdown("""
-<style>
-    /* Main background with subtle matrix grid */
-    .stApp {
-        background-color: #0a0a0a;
-        background-image: 
-            radial-gradient(#003300 0.5px, transparent 0.5px),
-            radial-gradient(#003300 0.5px, #0a0a0a 0.5px);
-        background-size: 20px 20px;
-        background-position: 0 0, 10px 10px;
-        color: #00ff41;
-        font-family: 'Courier New', 'Monaco', 'Menlo', monospace;
-        min-height: 100vh;
-    }
-    
-    /* Content containers - ensure visibility */
-    .main-container {
-        background: rgba(5, 15, 5, 0.98);
-        border-radius: 0px;
-        padding: 2rem;
-        margin: 1rem;
-        box-shadow: 
-            0 0 25px rgba(0, 255, 65, 0.4),
-            inset 0 0 20px rgba(0, 255, 65, 0.1);
-        border: 2px solid #00ff41;
-        backdrop-filter: blur(5px);
-        position: relative;
-        z-index: 1;
-    }
-    
-    /* Header styling - matrix green with strong glow */
-    .main-header {
-        font-size: 2.8rem;
-        color: #00ff41;
-        text-align: center;
-        margin-bottom: 0.5rem;
-        font-weight: 700;
-        text-shadow: 
-            0 0 10px #00ff41,
-            0 0 20px #00ff41,
-            0 0 30px #00ff41;
-        font-family: 'Courier New', monospace;
-        letter-spacing: 3px;
-        background: rgba(0, 25, 0, 0.9);
-        padding: 1.5rem;
-        border: 2px solid #00ff41;
-        position: relative;
-        animation: text-flicker 3s infinite alternate;
-    }
-    
-    @keyframes text-flicker {
-        0%, 19%, 21%, 23%, 25%, 54%, 56%, 100% {
-            opacity: 1;
-            text-shadow: 
-                0 0 10px #00ff41,
-                0 0 20px #00ff41,
-                0 0 30px #00ff41;
-        }
-        20%, 24%, 55% {
-            opacity: 0.9;
-            text-shadow: 
-                0 0 5px #00ff41,
-                0 0 10px #00ff41;
-        }
-    }
-    
-    .main-subheader {
-        text-align: center;
-        color: #00ff88;
-        margin-bottom: 2rem;
-        font-size: 1.2rem;
-        background: rgba(0, 30, 0, 0.8);
-        padding: 1rem;
-        border: 1px solid #00ff88;
-        font-family: 'Courier New', monospace;
-        text-shadow: 0 0 10px rgba(0, 255, 136, 0.5);
-    }
-    
-    /* Section headers - high visibility */
-    .section-header {
-        color: #00ff41;
-        border-bottom: 3px solid #00ff41;
-        padding-bottom: 0.8rem;
-        margin-bottom: 1.5rem;
-        font-weight: 700;
-        text-shadow: 0 0 10px #00ff41;
-        font-family: 'Courier New', monospace;
-        background: rgba(0, 30, 0, 0.7);
-        padding: 1.2rem;
-        margin-top: 1rem;
-        font-size: 1.5rem;
-        box-shadow: 0 0 15px rgba(0, 255, 65, 0.3);
-    }
-    
-    /* Form containers - ensure readability */
-    .form-container {
-        background: rgba(0, 35, 0, 0.9);
-        border-radius: 0px;
-        padding: 1.8rem;
-        margin-bottom: 1.5rem;
-        border-left: 5px solid #00ff41;
-        border-top: 1px solid #00aa00;
-        border-right: 1px solid #00aa00;
-        border-bottom: 1px solid #00aa00;
-        box-shadow: 0 0 20px rgba(0, 255, 65, 0.3);
-        position: relative;
-        z-index: 1;
-    }
-    
-    /* Buttons - matrix style */
-    .stButton button {
-        background: #002200;
-        color: #00ff41 !important;
-        border: 2px solid #00ff41;
-        border-radius: 0px;
-        padding: 0.8rem 2rem;
-        font-weight: 700;
-        font-family: 'Courier New', monospace;
-        transition: all 0.3s ease;
-        text-shadow: 0 0 8px #00ff41;
-        box-shadow: 0 0 15px rgba(0, 255, 65, 0.4);
-        position: relative;
-        overflow: hidden;
-        font-size: 1.1rem;
-    }
-    
-    .stButton button:hover {
-        background: #004400;
-        box-shadow: 
-            0 0 20px #00ff41,
-            0 0 30px rgba(0, 255, 65, 0.6);
-        transform: translateY(-2px);
-        border-color: #00ff88;
-    }
-    
-    /* Input fields - ensure visibility */
-    .stTextInput input {
-        background: #001a00 !important;
-        color: #00ff41 !important;
-        border: 2px solid #00ff41 !important;
-        border-radius: 0px !important;
-        padding: 0.8rem !important;
-        font-family: 'Courier New', monospace !important;
-        font-size: 1.1rem !important;
-        box-shadow: 0 0 10px rgba(0, 255, 65, 0.3) inset;
-    }
-    
-    .stTextInput input:focus {
-        box-shadow: 
-            0 0 15px #00ff41,
-            0 0 25px rgba(0, 255, 65, 0.4) inset;
-        background: #003300 !important;
-        border-color: #00ff88 !important;
-    }
-    
-    /* Select boxes */
-    .stSelectbox select {
-        background: #001a00 !important;
-        color: #00ff41 !important;
-        border: 2px solid #00ff41 !important;
-        border-radius: 0px !important;
-        padding: 0.8rem !important;
-        font-family: 'Courier New', monospace !important;
-        font-size: 1.1rem !important;
-        box-shadow: 0 0 10px rgba(0, 255, 65, 0.3) inset;
-    }
-    
-    /* Text areas */
-    .stTextArea textarea {
-        background: #001a00 !important;
-        color: #00ff41 !important;
-        border: 2px solid #00ff41 !important;
-        border-radius: 0px !important;
-        font-family: 'Courier New', monospace !important;
-        font-size: 1.1rem !important;
-        box-shadow: 0 0 10px rgba(0, 255, 65, 0.3) inset;
-        line-height: 1.6;
-    }
-    
-    /* Checkboxes and radio buttons */
-    .stCheckbox, .stRadio {
-        color: #00ff41 !important;
-        font-family: 'Courier New', monospace !important;
-    }
-    
-    .stCheckbox > div, .stRadio > div {
-        background: rgba(0, 30, 0, 0.8) !important;
-        border: 1px solid #00ff41 !important;
-        border-radius: 0px !important;
-        padding: 1rem !important;
-        box-shadow: 0 0 10px rgba(0, 255, 65, 0.2) inset !important;
-        color: #00ff41 !important;
-    }
-    
-    /* Success boxes - high contrast */
-    .success-box {
-        background: rgba(0, 50, 0, 0.95);
-        color: #00ff41;
-        padding: 1.5rem;
-        border-radius: 0px;
-        border: 2px solid #00ff41;
-        margin: 1.5rem 0;
-        box-shadow: 0 0 25px rgba(0, 255, 65, 0.5);
-        font-family: 'Courier New', monospace;
-        font-size: 1.1rem;
-        line-height: 1.6;
-        text-shadow: 0 0 5px #00ff41;
-    }
-    
-    /* Info boxes */
-    .info-box {
-        background: rgba(0, 35, 20, 0.95);
-        color: #00ff99;
-        padding: 1.5rem;
-        border-radius: 0px;
-        border: 2px solid #00ff99;
-        margin: 1.5rem 0;
-        box-shadow: 0 0 25px rgba(0, 255, 153, 0.4);
-        font-family: 'Courier New', monospace;
-        font-size: 1.1rem;
-        line-height: 1.6;
-        text-shadow: 0 0 5px #00ff99;
-    }
-    
-    /* Warning boxes */
-    .warning-box {
-        background: rgba(50, 50, 0, 0.95);
-        color: #ffff00;
-        padding: 1.5rem;
-        border-radius: 0px;
-        border: 2px solid #ffff00;
-        margin: 1.5rem 0;
-        box-shadow: 0 0 25px rgba(255, 255, 0, 0.4);
-        font-family: 'Courier New', monospace;
-        font-size: 1.1rem;
-        line-height: 1.6;
-        text-shadow: 0 0 5px #ffff00;
-    }
-    
-    /* Progress bars */
-    .stProgress > div > div > div {
-        background: linear-gradient(90deg, #00ff41, #00ff88);
-        box-shadow: 0 0 15px #00ff41;
-    }
-    
-    .stProgress > div > div {
-        background: #001100;
-        border: 2px solid #00ff41;
-        box-shadow: 0 0 15px rgba(0, 255, 65, 0.4) inset;
-    }
-    
-    /* Metric cards */
-    .metric-card {
-        background: rgba(0, 30, 0, 0.95);
-        border-radius: 0px;
-        padding: 1.5rem;
-        margin: 0.8rem 0;
-        box-shadow: 0 0 20px rgba(0, 255, 65, 0.3);
-        border-left: 5px solid #00ff41;
-        border-top: 1px solid #00aa00;
-        border-right: 1px solid #00aa00;
-        border-bottom: 1px solid #00aa00;
-        color: #00ff41;
-        font-family: 'Courier New', monospace;
-        font-size: 1.2rem;
-        font-weight: bold;
-        position: relative;
-        text-shadow: 0 0 5px #00ff41;
-    }
-    
-    /* Vertical divider */
-    .vertical-divider {
-        border-left: 3px solid #00ff41;
-        height: 100%;
-        margin: 0 2rem;
-        box-shadow: 0 0 15px #00ff41;
-    }
-    
-    /* Dataframes - readable matrix style */
-    .dataframe {
-        background: #001a00 !important;
-        color: #00ff41 !important;
-        border: 2px solid #00ff41 !important;
-        box-shadow: 0 0 20px rgba(0, 255, 65, 0.3);
-        font-family: 'Courier New', monospace !important;
-    }
-    
-    .dataframe th {
-        background: #003300 !important;
-        color: #00ff41 !important;
-        border: 2px solid #00ff41 !important;
-        font-weight: bold;
-        text-shadow: 0 0 8px #00ff41;
-        padding: 1rem !important;
-        font-size: 1.1rem;
-    }
-    
-    .dataframe td {
-        background: #001a00 !important;
-        color: #00ff41 !important;
-        border: 1px solid #005500 !important;
-        padding: 0.8rem !important;
-        font-size: 1rem;
-    }
-    
-    /* File uploader */
-    .stFileUploader > div {
-        background: rgba(0, 30, 0, 0.9) !important;
-        border: 2px dashed #00ff41 !important;
-        border-radius: 0px !important;
-        color: #00ff41 !important;
-    }
-    
-    /* Expanders */
-    .streamlit-expanderHeader {
-        background: rgba(0, 40, 0, 0.95) !important;
-        color: #00ff41 !important;
-        border: 2px solid #00ff41 !important;
-        font-family: 'Courier New', monospace !important;
-        font-weight: bold;
-        text-shadow: 0 0 8px #00ff41;
-        font-size: 1.1rem;
-    }
-    
-    .streamlit-expanderContent {
-        background: rgba(0, 25, 0, 0.9) !important;
-        border: 1px solid #003300 !important;
-        color: #00ff41 !important;
-        font-family: 'Courier New', monospace !important;
-    }
-    
-    /* Tabs */
-    .stTabs [data-baseweb="tab-list"] {
-        background: #001100;
-        border-bottom: 3px solid #00ff41;
-        box-shadow: 0 0 15px rgba(0, 255, 65, 0.3);
-    }
-    
-    .stTabs [data-baseweb="tab"] {
-        color: #00cc33;
-        font-family: 'Courier New', monospace;
-        font-weight: bold;
-        font-size: 1.1rem;
-    }
-    
-    .stTabs [aria-selected="true"] {
-        color: #00ff41 !important;
-        background: rgba(0, 255, 65, 0.15);
-        text-shadow: 0 0 10px #00ff41;
-        border-bottom: 3px solid #00ff41;
-    }
-    
-    /* Markdown text - ensure readability */
-    .stMarkdown {
-        color: #00ff41;
-        font-family: 'Courier New', monospace;
-        line-height: 1.7;
-        font-size: 1.05rem;
-    }
-    
-    .stMarkdown strong {
-        color: #00ff88;
-        text-shadow: 0 0 8px #00ff88;
-    }
-    
-    /* Code blocks */
-    .stCodeBlock {
-        background: #001100 !important;
-        border: 2px solid #00ff41 !important;
-        border-radius: 0px !important;
-        box-shadow: 0 0 20px rgba(0, 255, 65, 0.4);
-        color: #00ff41 !important;
-        font-family: 'Courier New', monospace !important;
-        font-size: 1rem;
-    }
-    
-    /* Ensure all text is visible with proper contrast */
-    * {
-        text-shadow: 0 0 2px rgba(0, 255, 65, 0.7);
-    }
-    
-    /* Labels and titles */
-    label {
-        color: #00ff88 !important;
-        font-weight: bold !important;
-        text-shadow: 0 0 5px #00ff88;
-    }
-    
-    /* Sidebar styling */
-    .css-1d391kg, .css-1lcbm6i {
-        background: #0a0a0a !important;
-        border-right: 2px solid #00ff41;
-        box-shadow: 0 0 25px rgba(0, 255, 65, 0.3);
-    }
-    
-    /* Scrollbar styling */
-    ::-webkit-scrollbar {
-        width: 10px;
-    }
-    
-    ::-webkit-scrollbar-track {
-        background: #001100;
-    }
-    
-    ::-webkit-scrollbar-thumb {
-        background: #00ff41;
-        box-shadow: 0 0 15px #00ff41;
-    }
-    
-    ::-webkit-scrollbar-thumb:hover {
-        background: #00ff88;
-    }
-    
-    /* Error messages */
-    .stAlert {
-        background: rgba(50, 0, 0, 0.95) !important;
-        border: 2px solid #ff4444 !important;
-        color: #ff4444 !important;
-        text-shadow: 0 0 8px #ff4444;
-    }
-</style>
-""", unsafe_allow_html=True)
+st.markdown(f"<style>\n{load_theme_css()}</style>", unsafe_allow_html=True)
 
 def ensure_wordlists_folder():
     """Create wordlists folder if it doesn't exist"""
@@ -450,7 +37,8 @@ def ensure_wordlists_folder():
 
 def generate_filename(first_name, last_name, mode):
     """Generate a filename with timestamp and mode"""
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    # Microseconds keep two generations started within the same second apart
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
     return f"wordlists/{mode}_wordlist_{first_name}_{last_name}_{timestamp}.txt"
 
 def clear_all():
@@ -459,47 +47,64 @@ def clear_all():
         del st.session_state[key]
     st.rerun()
 
+def stop_generation_worker(worker, stop_event, timeout: float = 5.0):
+    """Stop a generation process, waiting for it to close its file"""
+    stop_event.set()
+    worker.join(timeout)
+    if worker.is_alive():
+        worker.terminate()
+        worker.join()
+
+def stop_generation_workers():
+    """Stop all of this session's generation processes"""
+    workers = st.session_state.pop("generation_workers", [])
+    for worker, stop_event in workers:
+        stop_event.set()
+    for worker, stop_event in workers:
+        stop_generation_worker(worker, stop_event)
+
 def exit_app():
-    """Exit the application"""
+    """End this session (the server keeps running for other sessions)"""
+    stop_generation_workers()
     st.markdown("""
     <div style="background: rgba(50, 0, 0, 0.95); color: #ff4444; padding: 1.5rem; border-radius: 0px; border: 2px solid #ff4444; margin: 1.5rem 0; box-shadow: 0 0 25px rgba(255, 68, 68, 0.4);">
         <h3 style='color: #ff4444; text-shadow: 0 0 10px #ff4444;'>🚪 Exiting Application</h3>
         <p style='color: #ff4444;'>Thank you for using Wordlist Generator!</p>
-        <p style='color: #ff4444;'>This window will close automatically.</p>
+        <p style='color: #ff4444;'>You can now close this window.</p>
     </div>
     """, unsafe_allow_html=True)
-    time.sleep(3)
-    sys.exit(0)
+    # Browsers only honour this for windows opened by a script
+    st.html("<script>setTimeout(() => window.close(), 3000);</script>", unsafe_allow_javascript=True)
+    st.stop()
 
-def analyze_duplicates(uploaded_file):
-    """Analyze uploaded wordlist for exact duplicates"""
+@st.cache_data(show_spinner=False, max_entries=8, ttl=3600)
+def analyze_duplicates(file_bytes: bytes):
+    """Analyze uploaded wordlist for exact duplicates (cached on the file contents)"""
     try:
-        # Read the uploaded file
-        content = uploaded_file.getvalue().decode("utf-8")
-        lines = content.split('\n')
+        # Decode the file line by line instead of materializing the whole
+        # text and a list of its lines
+        lines = io.TextIOWrapper(io.BytesIO(file_bytes), encoding="utf-8", newline="\n")
         
-        # Count exact duplicates (case-sensitive, exact match)
-        word_counts = Counter()
-        total_words = 0
-        unique_words = set()
+        # Count exact duplicates (case-sensitive, exact match) of non-empty
+        # lines; Counter(iterable) counts in C
+        word_counts = Counter(filter(None, map(str.strip, lines)))
+        total_words = sum(word_counts.values())
+        unique_words = len(word_counts)
+        extra_copies = total_words - unique_words  # Every repeat beyond a word's first line
         
-        for line in lines:
-            word = line.strip()
-            if word:  # Only process non-empty lines
-                word_counts[word] += 1
-                unique_words.add(word)
-                total_words += 1
-        
-        # Find duplicates (words with count > 1)
-        duplicates = {word: count for word, count in word_counts.items() if count > 1}
+        # Find duplicates (words with count > 1), most repeated first
+        duplicates = tuple(sorted(
+            [(word, count) for word, count in word_counts.items() if count > 1],
+            key=itemgetter(1), reverse=True
+        ))
         
         # Calculate statistics
         stats = {
             'total_words': total_words,
-            'unique_words': len(unique_words),
+            'unique_words': unique_words,
             'duplicate_words': len(duplicates),
-            'total_duplicates': sum(duplicates.values()) - len(duplicates),  # Total extra copies
-            'duplicate_percentage': (len(duplicates) / len(unique_words)) * 100 if unique_words else 0
+            'total_duplicates': extra_copies,
+            'duplicate_percentage': 100.0 * extra_copies / total_words if total_words else 0.0  # Share of redundant lines
         }
         
         return duplicates, stats, None
@@ -580,6 +185,9 @@ def main():
                 if not first_name or not last_name:
                     st.error("❌ Please provide both First Name and Last Name")
                 else:
+                    # Imported on first use to keep cold starts fast
+                    from core.generator import generate_in_background
+                    
                     # Initialize progress
                     progress_bar = st.progress(0)
                     status_text = st.empty()
@@ -587,53 +195,62 @@ def main():
                     stats_placeholder = st.empty()
                     warning_text = st.empty()
                     
-                    generated_words = []
-                    start_time = time.time()
+                    # Only the live preview is kept in memory; the worker writes the rest
+                    preview_count = 10
+                    preview_words = deque(maxlen=preview_count)
+                    start_time = time.monotonic()
                     MAX_GENERATION_TIME = 120  # 2 minutes max
+                    deadline = start_time + MAX_GENERATION_TIME
                     
                     def should_continue():
-                        return time.time() - start_time < MAX_GENERATION_TIME
+                        return time.monotonic() < deadline
+                    
+                    # The worker reports every update_interval words; the page polls
+                    # its queue and refreshes the UI at most once per poll.
+                    # Mode-dependent constants are fixed for the whole run.
+                    update_interval = 1000
+                    poll_interval = 0.1
+                    expected_words = 1000 if mode == "basic" else 5000
+                    inv_expected = 1.0 / expected_words
+                    
+                    # Last values sent to the slower-changing widgets, so unchanged
+                    # ones are not re-sent to the browser on every poll
+                    shown_percent = -1
+                    shown_second = -1
                     
-                    def update_callback(word, count, duplicates):
-                        if not should_continue():
-                            warning_text.warning("⚠️ Generation taking too long. Consider using Basic mode or reducing patterns.")
+                    def update_progress(count, duplicates):
+                        nonlocal shown_percent, shown_second
+                        
+                        percent = min(int(count * inv_expected * 100), 100)
+                        if percent != shown_percent:
+                            shown_percent = percent
+                            progress_bar.progress(percent)
+                        
+                        status_text.text(f"🔄 Generating... {count} words ({duplicates} duplicates prevented)")
+                        
+                        # Show preview
+                        preview_content = "\n".join(preview_words)
+                        
+                        with preview_text.container():
+                            st.markdown(f"**Live Preview (Last {preview_count} words):**")
+                            st.code(preview_content)
+                        
+                        # Update stats (at most once per second of elapsed time)
+                        elapsed = time.monotonic() - start_time
+                        if int(elapsed) == shown_second:
                             return
-                            
-                        generated_words.append(word)
+                        shown_second = int(elapsed)
+                        wps = count / elapsed if elapsed > 0 else 0
                         
-                        update_interval = 50 if mode == "basic" else 20
-                        if count % update_interval == 0:
-                            expected_words = 1000 if mode == "basic" else 5000
-                            progress = min(count / expected_words, 1.0)
-                            progress_bar.progress(progress)
-                            
-                            status_text.text(f"🔄 Generating... {count} words ({duplicates} duplicates prevented)")
-                            
-                            # Show preview
-                            preview_count = 10
-                            if len(generated_words) > preview_count:
-                                preview_content = "\n".join(generated_words[-preview_count:])
-                            else:
-                                preview_content = "\n".join(generated_words)
-                            
-                            with preview_text.container():
-                                st.markdown(f"**Live Preview (Last {preview_count} words):**")
-                                st.code(preview_content)
-                            
-                            # Update stats
-                            current_time = time.time()
-                            elapsed = current_time - start_time
-                            wps = count / elapsed if elapsed > 0 else 0
-                            
-                            with stats_placeholder.container():
-                                cols = st.columns(4)
-                                cols[0].metric("Words", f"{count}")
-                                cols[1].metric("Duplicates", f"{duplicates}")
-                                cols[2].metric("Time", f"{elapsed:.1f}s")
-                                cols[3].metric("Speed", f"{wps:.0f}/s")
+                        with stats_placeholder.container():
+                            cols = st.columns(4)
+                            cols[0].metric("Words", f"{count}")
+                            cols[1].metric("Duplicates", f"{duplicates}")
+                            cols[2].metric("Time", f"{elapsed:.1f}s")
+                            cols[3].metric("Speed", f"{wps:.0f}/s")
                     
                     try:
-                        generator = create_generator(
+                        params = dict(
                             mode=mode,
                             first_name=first_name,
                             last_name=last_name,
@@ -649,26 +266,79 @@ def main():
                         
                         output_file = generate_filename(first_name, last_name, mode)
                         
-                        with StreamingFileWriter(output_file) as writer:
-                            for word in generator.generate_with_callback(update_callback):
-                                if not should_continue():
+                        # Generate in a separate process so the string work runs outside
+                        # this interpreter's GIL and the page stays responsive. Spawned,
+                        # not forked: forking the threaded server can deadlock the child
+                        mp_context = multiprocessing.get_context("spawn")
+                        progress_queue = mp_context.Queue()
+                        stop_event = mp_context.Event()
+                        worker = mp_context.Process(
+                            target=generate_in_background,
+                            args=(params, output_file, progress_queue, stop_event, update_interval, preview_count),
+                            daemon=True
+                        )
+                        worker.start()
+                        # Tracked so exit_app can stop it if this run is interrupted
+                        session_workers = st.session_state.setdefault("generation_workers", [])
+                        session_workers.append((worker, stop_event))
+                        
+                        result = None
+                        try:
+                            while result is None:
+                                alive = worker.is_alive()  # Checked first: a dead worker has sent everything
+                                message = None
+                                latest = None
+                                try:
+                                    message = progress_queue.get(timeout=poll_interval)
+                                    while True:
+                                        kind = message[0]
+                                        if kind == "progress":
+                                            preview_words.extend(message[1])
+                                            latest = message[2:]
+                                        elif kind == "event":
+                                            preview_words.append(message[1])
+                                        else:  # "done" or "error"
+                                            result = message
+                                            break
+                                        message = progress_queue.get_nowait()
+                                except queue.Empty:
+                                    if message is None and not alive:
+                                        raise RuntimeError("Generation process exited unexpectedly")
+                                
+                                if latest is not None:
+                                    update_progress(*latest)
+                                
+                                if result is None and not stop_event.is_set() and not should_continue():
+                                    stop_event.set()
                                     warning_text.warning("⏰ Generation stopped due to timeout")
-                                    break
-                                writer.add_word(word)
+                        finally:
+                            # Also reached on errors and when Streamlit interrupts this run;
+                            # the worker then stops after its current batch and closes the file
+                            stop_generation_worker(worker, stop_event)
+                            if (worker, stop_event) in session_workers:
+                                session_workers.remove((worker, stop_event))
+                        
+                        if result[0] == "error":
+                            raise RuntimeError(result[1])
                         
-                        stats = generator.get_statistics()
+                        stats = result[1]
                         progress_bar.progress(1.0)
                         
                         st.success(f"✅ Generated {stats['total_generated']:,} words in {stats['generation_time']:.2f}s")
                         
-                        # Download section
-                        with open(output_file, 'r') as f:
-                            st.download_button(
-                                "💾 Download Wordlist",
-                                f.read(),
-                                file_name=os.path.basename(output_file),
-                                use_container_width=True
-                            )
+                        # Download section: hand over the raw bytes, no decode/re-encode round trip
+                        if os.path.getsize(output_file) > MAX_DOWNLOAD_BYTES:
+                            st.warning(f"⚠️ Wordlist is over {MAX_DOWNLOAD_BYTES // (1024 * 1024)} MB, "
+                                       f"too large to download here. Find it at {output_file}")
+                        else:
+                            with open(output_file, 'rb') as f:
+                                st.download_button(
+                                    "💾 Download Wordlist",
+                                    f,
+                                    file_name=os.path.basename(output_file),
+                                    mime="text/plain",
+                                    use_container_width=True
+                                )
                         
                     except Exception as e:
                         st.error(f"❌ Error: {str(e)}")
@@ -711,7 +381,7 @@ def main():
                 # Analyze button
                 if st.button("🔎 Analyze for Duplicates", type="primary", use_container_width=True, key="analyze_btn"):
                     with st.spinner("Analyzing wordlist for duplicates..."):
-                        duplicates, stats, error = analyze_duplicates(uploaded_file)
+                        duplicates, stats, error = analyze_duplicates(uploaded_file.getvalue())
                         
                         if error:
                             st.error(f"❌ Error analyzing file: {error}")
@@ -727,35 +397,30 @@ def main():
                             
                             # Display duplicate details
                             if duplicates:
-                                st.markdown("**📋 Duplicate Words Found**")
+                                import pandas as pd  # Only needed for the duplicate table and chart
                                 
-                                # Create sorted list of duplicates
-                                sorted_duplicates = sorted(duplicates.items(), key=lambda x: x[1], reverse=True)
+                                st.markdown("**📋 Duplicate Words Found**")
                                 
-                                # Display in a table
-                                duplicate_data = []
-                                for word, count in sorted_duplicates:
-                                    duplicate_data.append({
-                                        "Word": word,
-                                        "Count": count,
-                                        "Extra Copies": count - 1
-                                    })
+                                # Duplicates come back already sorted by count
+                                sorted_duplicates = duplicates
                                 
-                                df_duplicates = pd.DataFrame(duplicate_data)
+                                # Display the most repeated words in a table (built column-wise,
+                                # no per-row dicts); the full list is in the downloadable report
+                                max_table_rows = 1000
+                                df_duplicates = pd.DataFrame(sorted_duplicates[:max_table_rows], columns=["Word", "Count"])
+                                df_duplicates["Extra Copies"] = df_duplicates["Count"] - 1
                                 st.dataframe(
                                     df_duplicates,
                                     use_container_width=True,
                                     height=300
                                 )
+                                if len(sorted_duplicates) > max_table_rows:
+                                    st.caption(f"Showing the top {max_table_rows:,} of {len(sorted_duplicates):,} duplicate words. Download the report for the full list.")
                                 
                                 # Show top duplicates chart
                                 st.markdown("**📈 Top Duplicates**")
-                                top_10 = sorted_duplicates[:10]
-                                chart_data = pd.DataFrame({
-                                    'Word': [item[0] for item in top_10],
-                                    'Count': [item[1] for item in top_10]
-                                })
-                                st.bar_chart(chart_data.set_index('Word'))
+                                # The table frame is already sorted by count, so the chart reuses its first rows
+                                st.bar_chart(df_duplicates.head(10).set_index('Word')[['Count']])
                                 
                                 # Download report
                                 st.markdown("**📥 Download Analysis Report**")
@@ -772,8 +437,7 @@ Duplicate Rate: {stats['duplicate_percentage']:.1f}%
 
 DUPLICATE WORDS:
 """
-                                for word, count in sorted_duplicates:
-                                    report_content += f"{word} -> {count} times\n"
+                                report_content += "".join([f"{word} -> {count} times\n" for word, count in sorted_duplicates])
                                 
                                 st.download_button(
                                     "📄 Download Duplicate Report",
@@ -7,7 +7,6 @@ from datetime import datetime
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from core.generator import create_generator
-from core.stream_writer import StreamingFileWriter
 from utils.file_handler import FileHandler
 
 def main():
@@ -47,21 +46,17 @@ def main():
         special_chars=not args.no_special_chars
     )
     
-    # Progress callback
-    def progress_callback(word, count, duplicates):
-        if args.show_progress and count % 100 == 0:
+    # Progress callback (words arrive in batches of 100)
+    def progress_callback(words, count, duplicates):
+        if args.show_progress and not isinstance(words, dict):
             print(f"Generated {count} words, prevented {duplicates} duplicates...", end='\r')
     
     # Generate wordlist
-    word_count = 0
     duplicate_count = 0
     print(f"🚀 Starting {args.mode.upper()} mode wordlist generation...")
     start_time = datetime.now()
     
-    with StreamingFileWriter(args.output) as writer:
-        for word in generator.generate_with_callback(progress_callback):
-            writer.add_word(word)
-            word_count += 1
+    word_count = generator.generate_to_file(args.output, progress_callback, callback_every=100)
     
     end_time = datetime.now()
     generation_time = (end_time - start_time).total_seconds()
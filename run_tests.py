@@ -7,12 +7,93 @@ Compatible with Windows, Linux, and Mac
 import unittest
 import sys
 import os
+import io
+import json
 import time
+import functools
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 
 # Add the current directory to Python path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
+# Per-test durations from the previous run, used to run the quickest tests first
+DURATIONS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.test_durations.json')
+
+def _load_durations():
+    """Recorded test durations in seconds, keyed by test id (empty if none yet)"""
+    try:
+        with open(DURATIONS_FILE, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def _save_durations(durations):
+    """Record test durations for the next run"""
+    try:
+        with open(DURATIONS_FILE, 'w', encoding='utf-8') as f:
+            json.dump(durations, f, indent=2, sort_keys=True)
+    except OSError as e:
+        print(f"⚠️  Could not save test durations: {e}")
+
+def _iter_tests(suite):
+    """Yield the individual tests of a (nested) suite"""
+    for item in suite:
+        if isinstance(item, unittest.TestSuite):
+            yield from _iter_tests(item)
+        else:
+            yield item
+
+def _shortest_first(tests, durations):
+    """Suite ordered by recorded duration; each test class stays contiguous for its fixtures"""
+    by_class = {}
+    for test in tests:
+        by_class.setdefault(type(test), []).append(test)
+    groups = [sorted(group, key=lambda test: durations.get(test.id(), 0.0)) for group in by_class.values()]
+    groups.sort(key=lambda group: sum(durations.get(test.id(), 0.0) for test in group))
+    return unittest.TestSuite([test for group in groups for test in group])
+
+class _TimedTextTestResult(unittest.TextTestResult):
+    """TextTestResult that also records how long each test took"""
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.test_durations = {}
+        self._test_started = 0.0
+    
+    def startTest(self, test):
+        self._test_started = time.perf_counter()
+        super().startTest(test)
+    
+    def stopTest(self, test):
+        super().stopTest(test)
+        self.test_durations[test.id()] = time.perf_counter() - self._test_started
+
+@functools.lru_cache(maxsize=1)
+def _discover_modules(start_dir, pattern):
+    """Discover the test suite once per process, as a tuple of per-module suites"""
+    return tuple(unittest.TestLoader().discover(start_dir, pattern=pattern))
+
+def _run_module_suite(job):
+    """Run one discovered test module in a worker process; returns picklable results"""
+    start_dir, pattern, index, durations, failfast = job
+    # Rediscover instead of pickling test objects (this also covers modules that
+    # failed to import); a worker given several modules discovers only once
+    suite = _shortest_first(_iter_tests(_discover_modules(start_dir, pattern)[index]), durations)
+    stream = io.StringIO()
+    # buffer=True also captures what the tests print, replaying it only for failing tests
+    runner = unittest.TextTestRunner(verbosity=1, stream=stream, buffer=True, failfast=failfast,
+                                     resultclass=_TimedTextTestResult)
+    result = runner.run(suite)
+    return {
+        "tests_run": result.testsRun,
+        "failures": [(str(test), traceback) for test, traceback in result.failures],
+        "errors": [(str(test), traceback) for test, traceback in result.errors],
+        "output": stream.getvalue(),
+        "durations": result.test_durations
+    }
+
 def run_all_tests():
     """Run all tests in the tests directory"""
     print("🧪 Starting Wordlist Generator Test Suite...")
@@ -20,7 +101,6 @@ def run_all_tests():
     print("=" * 60)
     
     # Discover and run tests
-    loader = unittest.TestLoader()
     start_dir = os.path.join(os.path.dirname(__file__), 'tests')
     
     # Create tests directory if it doesn't exist
@@ -29,49 +109,80 @@ def run_all_tests():
         print(f"📁 Created tests directory: {start_dir}")
     
     try:
-        suite = loader.discover(start_dir, pattern='test_*.py')
+        modules = _discover_modules(start_dir, 'test_*.py')
     except Exception as e:
         print(f"❌ Error discovering tests: {e}")
         print("💡 Creating sample test files...")
         create_sample_tests()
-        suite = loader.discover(start_dir, pattern='test_*.py')
+        modules = _discover_modules(start_dir, 'test_*.py')
     
-    # Run tests with detailed output
-    runner = unittest.TextTestRunner(verbosity=2, stream=sys.stdout)
-    result = runner.run(suite)
+    # Run each test module in its own worker process, one per CPU core.
+    # Modules and tests with the shortest recorded durations go first so failures
+    # surface sooner; TEST_FAIL_FIRST=1 stops at the first failure.
+    durations = _load_durations()
+    failfast = os.environ.get("TEST_FAIL_FIRST") == "1"
+    module_order = sorted(
+        range(len(modules)),
+        key=lambda index: sum(durations.get(test.id(), 0.0) for test in _iter_tests(modules[index]))
+    )
+    jobs = [(start_dir, 'test_*.py', index, durations, failfast) for index in module_order]
+    tests_run = 0
+    failures = []
+    errors = []
+    if jobs:
+        # Executor workers are not daemonic, so tests may start their own process pools
+        with ProcessPoolExecutor(min(os.cpu_count() or 1, len(jobs))) as executor:
+            # Runner output is only shown for modules with failures or errors;
+            # map keeps the job order
+            for module_result in executor.map(_run_module_suite, jobs):
+                if module_result["failures"] or module_result["errors"]:
+                    sys.stdout.write(module_result["output"])
+                tests_run += module_result["tests_run"]
+                failures += module_result["failures"]
+                errors += module_result["errors"]
+                durations.update(module_result["durations"])
+                if failfast and (failures or errors):
+                    executor.shutdown(wait=False, cancel_futures=True)
+                    break
+        _save_durations(durations)
     
     # Print summary
     print("=" * 60)
     print("📊 TEST SUMMARY")
-    print(f"✅ Tests Run: {result.testsRun}")
-    print(f"✅ Passed: {result.testsRun - len(result.failures) - len(result.errors)}")
-    print(f"❌ Failures: {len(result.failures)}")
-    print(f"🚨 Errors: {len(result.errors)}")
+    print(f"✅ Tests Run: {tests_run}")
+    print(f"✅ Passed: {tests_run - len(failures) - len(errors)}")
+    print(f"❌ Failures: {len(failures)}")
+    print(f"🚨 Errors: {len(errors)}")
     
     # Print failures and errors if any
-    if result.failures:
+    if failures:
         print("\n📋 FAILURES:")
-        for test, traceback in result.failures:
+        for test, traceback in failures:
             print(f"   ❌ {test}: {traceback.splitlines()[-1]}")
     
-    if result.errors:
+    if errors:
         print("\n🚨 ERRORS:")
-        for test, traceback in result.errors:
+        for test, traceback in errors:
             print(f"   💥 {test}: {traceback.splitlines()[-1]}")
     
-    return result.wasSuccessful()
+    return not failures and not errors
 
 def create_sample_tests():
     """Create sample test files if tests directory is empty"""
     tests_dir = os.path.join(os.path.dirname(__file__), 'tests')
     
+    # Never overwrite or duplicate an existing suite
+    if any(f.startswith('test_') and f.endswith('.py') for f in os.listdir(tests_dir)):
+        print("ℹ️  Test files already exist, not creating samples")
+        return
+    
     # Create __init__.py
     init_file = os.path.join(tests_dir, '__init__.py')
     with open(init_file, 'w') as f:
         f.write('# Tests package\n')
     
     # Create basic test file
-    test_file = os.path.join(tests_dir, 'test_basic.py')
+    test_file = os.path.join(tests_dir, 'test_sample.py')
     with open(test_file, 'w') as f:
         f.write('''
 import unittest
@@ -83,8 +194,8 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 from core.generator import create_generator
 
-class TestBasicFunctionality(unittest.TestCase):
-    """Basic functionality tests"""
+class TestSampleSmoke(unittest.TestCase):
+    """Sample smoke tests"""
     
     def test_generator_creation(self):
         """Test that generators can be created"""
@@ -221,6 +332,7 @@ def check_system_requirements():
     return all_met
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()
     start_time = time.time()
     
     # System check
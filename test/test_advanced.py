@@ -2,6 +2,7 @@
 Advanced tests for Wordlist Generator
 """
 
+import itertools
 import unittest
 import sys
 import os
@@ -24,12 +25,8 @@ class TestAdvancedFeatures(unittest.TestCase):
         
         # Test that performance stats are collected
         start_time = time.time()
-        word_count = 0
-        
-        for word in generator.generate_with_callback():
-            word_count += 1
-            if word_count >= 100:  # Generate 100 words
-                break
+        for _ in itertools.islice(generator.generate_with_callback(), 100):  # Generate 100 words
+            pass
         
         elapsed = time.time() - start_time
         stats = generator.get_statistics()
@@ -49,11 +46,8 @@ class TestAdvancedFeatures(unittest.TestCase):
         )
         
         # Generate words and check memory doesn't explode
-        word_count = 0
-        for word in generator.generate_with_callback():
-            word_count += 1
-            if word_count >= 500:  # Generate reasonable amount
-                break
+        for _ in itertools.islice(generator.generate_with_callback(), 500):  # Generate reasonable amount
+            pass
         
         stats = generator.get_statistics()
         self.assertLess(stats["peak_memory_mb"], 100.0)  # Should use reasonable memory
@@ -75,21 +69,109 @@ class TestAdvancedFeatures(unittest.TestCase):
         def callback(word, count, duplicates):
             nonlocal duplicate_count
             duplicate_count = duplicates
+            if isinstance(word, dict):  # System event, not a generated word
+                return
             if word in generated_words:
                 self.fail(f"Duplicate word generated: {word}")
             generated_words.add(word)
         
-        # Generate words
-        word_count = 0
-        for word in generator.generate_with_callback(callback):
-            word_count += 1
-            if word_count >= 200:  # Generate 200 words
-                break
+        # Generate the whole list: the first few hundred words of a run need
+        # not contain a duplicate, so checking only a prefix depends on word order
+        word_count = sum(1 for _ in generator.generate_with_callback(callback))
         
         # Check that duplicates were prevented
         self.assertGreater(duplicate_count, 0)
         self.assertEqual(len(generated_words), word_count)  # All words should be unique
 
+    def test_system_events(self):
+        """Test system notifications arrive as structured events"""
+        from core.generator import create_generator, format_system_event
+        
+        generator = create_generator(mode="advanced", first_name="event", last_name="test")
+        events = []
+        
+        def callback(word, count, duplicates):
+            if isinstance(word, dict):
+                events.append((word, count))
+        
+        for word in generator.generate_with_callback(callback):
+            self.assertIsInstance(word, str)
+        
+        last_event, count = events[-1]
+        self.assertEqual(last_event["type"], "system")
+        self.assertEqual(last_event["event"], "complete")
+        self.assertTrue(format_system_event(last_event, count).startswith("[SYSTEM] Generation complete"))
+    
+    def test_batched_callback(self):
+        """Test callback_every delivers every generated word in fixed-size batches"""
+        from core.generator import create_generator
+        
+        generator = create_generator(mode="advanced", first_name="batch", last_name="test")
+        batches = []
+        
+        def callback(words, count, duplicates):
+            if not isinstance(words, dict):
+                batches.append(list(words))
+        
+        generated = list(generator.generate_with_callback(callback, callback_every=100))
+        
+        self.assertTrue(all(len(batch) == 100 for batch in batches[:-1]))
+        self.assertEqual([word for batch in batches for word in batch], generated)
+
+    def test_word_counts_match_reference(self):
+        """Test output sizes for inputs that stay under the per-word limit"""
+        from core.generator import create_generator
+
+        # Reference counts from the original implementation
+        cases = [
+            (dict(append_numbers=False, prepend_numbers=False), 1520),
+            (dict(special_chars=False), 4010),
+        ]
+        for options, expected in cases:
+            generator = create_generator(mode="advanced", first_name="john", last_name="doe", **options)
+            self.assertEqual(sum(1 for _ in generator.generate_with_callback()), expected)
+
+    def test_parallel_expansion(self):
+        """Test worker-pool expansion produces the same words as sequential"""
+        from core.generator import create_generator
+        
+        options = dict(first_name="john", last_name="doe")
+        sequential = create_generator(mode="advanced", workers=1, **options)
+        parallel = create_generator(mode="advanced", workers=2, **options)
+        
+        self.assertEqual(list(sequential.generate_with_callback()),
+                         list(parallel.generate_with_callback()))
+
+class TestBloomFilter(unittest.TestCase):
+    """Bloom filter tests"""
+    
+    def test_add_if_new(self):
+        """Test single-pass insert reports new and known items"""
+        from core.optimizations import BloomFilter
+        
+        bloom = BloomFilter(expected_items=1000, false_positive_rate=0.01)
+        
+        self.assertTrue(bloom.add_if_new("johndoe"))
+        self.assertFalse(bloom.add_if_new("johndoe"))
+        self.assertTrue(bloom.contains("johndoe"))
+
+class TestTrieDeduplicator(unittest.TestCase):
+    """Trie deduplicator tests"""
+    
+    def test_add_if_new_across_batches(self):
+        """Test items stay known after pending batches are frozen into tries"""
+        from core.optimizations import MARISA_AVAILABLE, TrieDeduplicator
+        
+        if not MARISA_AVAILABLE:
+            self.skipTest("marisa-trie not installed")
+        
+        dedup = TrieDeduplicator(batch_size=10)
+        words = [f"johndoe{i}" for i in range(100)]
+        
+        self.assertTrue(all(dedup.add_if_new(word) for word in words))
+        self.assertFalse(any(dedup.add_if_new(word) for word in words))
+        self.assertEqual(len(dedup), 100)
+
 class TestIntegration(unittest.TestCase):
     """Integration tests"""
     
@@ -116,12 +198,8 @@ class TestIntegration(unittest.TestCase):
             
             # Write to file
             with StreamingFileWriter(output_file) as writer:
-                word_count = 0
-                for word in generator.generate_with_callback():
+                for word in itertools.islice(generator.generate_with_callback(), 100):
                     writer.add_word(word)
-                    word_count += 1
-                    if word_count >= 100:
-                        break
             
             # Verify file content
             with open(output_file, 'r') as f:
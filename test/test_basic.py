@@ -3,6 +3,7 @@ Basic functionality tests for Wordlist Generator
 Windows-compatible version
 """
 
+import itertools
 import unittest
 import sys
 import os
@@ -84,11 +85,8 @@ class TestBasicFunctionality(unittest.TestCase):
         )
         
         # Generate a few words to trigger performance monitoring
-        word_count = 0
-        for word in generator.generate_with_callback():
-            word_count += 1
-            if word_count >= 10:  # Just test a few words
-                break
+        for _ in itertools.islice(generator.generate_with_callback(), 10):  # Just test a few words
+            pass
         
         stats = generator.get_statistics()
         self.assertIn("peak_memory_mb", stats)
@@ -112,12 +110,8 @@ class TestBasicFunctionality(unittest.TestCase):
             
             # Generate and write words
             with StreamingFileWriter(output_file) as writer:
-                word_count = 0
-                for word in generator.generate_with_callback():
+                for word in itertools.islice(generator.generate_with_callback(), 50):  # Limit for testing
                     writer.add_word(word)
-                    word_count += 1
-                    if word_count >= 50:  # Limit for testing
-                        break
             
             # Check file was created and has content
             self.assertTrue(os.path.exists(output_file))
@@ -131,6 +125,77 @@ class TestBasicFunctionality(unittest.TestCase):
             if os.path.exists(output_file):
                 os.remove(output_file)
 
+    def test_generate_to_file(self):
+        """Test writing a wordlist directly to disk"""
+        from core.generator import create_generator
+        
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            output_file = os.path.join(tmp_dir, "nested", "wordlist.txt")
+            
+            generator = create_generator(
+                mode="basic",
+                first_name=self.test_first_name,
+                last_name=self.test_last_name
+            )
+            word_count = generator.generate_to_file(output_file)
+            
+            expected = list(create_generator(
+                mode="basic",
+                first_name=self.test_first_name,
+                last_name=self.test_last_name
+            ).generate_with_callback())
+            
+            with open(output_file, 'r', encoding='utf-8') as f:
+                self.assertEqual(f.read().splitlines(), expected)
+            self.assertEqual(word_count, len(expected))
+    
+    def test_generate_batches(self):
+        """Test batched generation written through add_words"""
+        from core.generator import create_generator
+        from core.stream_writer import StreamingFileWriter
+        
+        kwargs = dict(mode="basic", first_name=self.test_first_name, last_name=self.test_last_name)
+        expected = list(create_generator(**kwargs).generate_with_callback())
+        
+        batches = list(create_generator(**kwargs).generate_batches(100))
+        self.assertTrue(all(0 < len(batch) <= 100 for batch in batches))
+        
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            output_file = os.path.join(tmp_dir, "wordlist.txt")
+            with StreamingFileWriter(output_file) as writer:
+                for batch in batches:
+                    writer.add_words(batch)
+            
+            with open(output_file, 'r', encoding='utf-8') as f:
+                self.assertEqual(f.read().splitlines(), expected)
+            self.assertEqual(writer.word_count, len(expected))
+
+    def test_generate_in_background(self):
+        """Test the background generation target and its progress messages"""
+        import queue
+        import threading
+        from core.generator import create_generator, generate_in_background
+        
+        params = dict(mode="basic", first_name=self.test_first_name, last_name=self.test_last_name)
+        expected = list(create_generator(**params).generate_with_callback())
+        
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            output_file = os.path.join(tmp_dir, "wordlist.txt")
+            progress_queue = queue.Queue()
+            generate_in_background(params, output_file, progress_queue, threading.Event(), 100)
+            
+            messages = []
+            while not progress_queue.empty():
+                messages.append(progress_queue.get_nowait())
+            
+            self.assertEqual(messages[-1][0], "done")
+            self.assertEqual(messages[-1][1]["total_generated"], len(expected))
+            progress = [message for message in messages if message[0] == "progress"]
+            self.assertTrue(progress)
+            self.assertTrue(all(len(message[1]) <= 10 for message in progress))
+            with open(output_file, 'r', encoding='utf-8') as f:
+                self.assertEqual(f.read().splitlines(), expected)
+
 class TestErrorHandling(unittest.TestCase):
     """Test error handling and edge cases"""
     
@@ -158,6 +223,20 @@ class TestErrorHandling(unittest.TestCase):
         
         self.assertIsNotNone(generator)
         self.assertGreater(len(generator.base_words), 0)
+    
+    def test_failed_write_leaves_no_file(self):
+        """Test that an interrupted write does not leave a partial wordlist"""
+        from core.stream_writer import StreamingFileWriter
+        
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            output_file = os.path.join(tmp_dir, "wordlist.txt")
+            
+            with self.assertRaises(RuntimeError):
+                with StreamingFileWriter(output_file) as writer:
+                    writer.add_words(["alpha", "beta"])
+                    raise RuntimeError("interrupted")
+            
+            self.assertEqual(os.listdir(tmp_dir), [])
 
 class TestPatterns(unittest.TestCase):
     """Test pattern generation"""
@@ -177,15 +256,12 @@ class TestPatterns(unittest.TestCase):
             special_chars=False
         )
         
-        # Generate words and check for leet patterns
-        found_leet = False
-        word_count = 0
-        for word in generator.generate_with_callback():
-            if any(char in word for char in ['4', '3', '1', '0', '5', '7']):
-                found_leet = True
-            word_count += 1
-            if word_count >= 20:  # Check first 20 words
-                break
+        # Check the first 20 words for leet patterns, stopping at the first hit
+        leet_chars = frozenset('431057')
+        found_leet = any(
+            not leet_chars.isdisjoint(word)
+            for word in itertools.islice(generator.generate_with_callback(), 20)
+        )
         
         self.assertTrue(found_leet, "Should generate leet speak variations")
 
@@ -1,3 +1,4 @@
+import itertools
 import unittest
 import tempfile
 import os
@@ -53,12 +54,8 @@ class TestWordlistGenerator(unittest.TestCase):
             )
             
             with StreamingFileWriter(output_file) as writer:
-                word_count = 0
-                for word in generator.generate_with_callback():
+                for word in itertools.islice(generator.generate_with_callback(), 100):  # Limit for testing
                     writer.add_word(word)
-                    word_count += 1
-                    if word_count >= 100:  # Limit for testing
-                        break
             
             # Check file was created and has content
             self.assertTrue(os.path.exists(output_file))
@@ -1,4 +1,5 @@
 import os
+import heapq
 import json
 from datetime import datetime
 from typing import Set, List, Dict
@@ -10,13 +11,21 @@ class FileHandler:
         if not os.path.exists(directory):
             os.makedirs(directory)
     
+    @staticmethod
+    def _alnum_only(text: str) -> str:
+        """Keep only the alphanumeric characters of text"""
+        if text.isalnum():  # Typical names: one C-level check, no rebuild
+            return text
+        return "".join([c for c in text if c.isalnum()])
+    
     @staticmethod
     def generate_filename(first_name: str, last_name: str, base_dir: str = "wordlists") -> str:
         """Generate a unique filename with timestamp"""
         FileHandler.ensure_directory(base_dir)
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        safe_first = "".join(c for c in first_name if c.isalnum())
-        safe_last = "".join(c for c in last_name if c.isalnum())
+        # Microseconds keep two files generated within the same second apart
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+        safe_first = FileHandler._alnum_only(first_name)
+        safe_last = FileHandler._alnum_only(last_name)
         return os.path.join(base_dir, f"wordlist_{safe_first}_{safe_last}_{timestamp}.txt")
     
     @staticmethod
@@ -25,28 +34,33 @@ class FileHandler:
         if not os.path.exists(directory):
             return []
         
-        wordlists = []
-        for filename in os.listdir(directory):
-            if filename.endswith(".txt"):
-                filepath = os.path.join(directory, filename)
-                stats = os.stat(filepath)
-                wordlists.append({
-                    "filename": filename,
-                    "path": filepath,
-                    "size": stats.st_size,
-                    "created": datetime.fromtimestamp(stats.st_ctime),
-                    "modified": datetime.fromtimestamp(stats.st_mtime)
-                })
+        # scandir entries carry the file type (and on Windows the stat) from the directory read
+        with os.scandir(directory) as entries:
+            files = [(entry, entry.stat()) for entry in entries
+                     if entry.name.endswith(".txt") and entry.is_file()]
         
-        # Sort by modification time, newest first
-        wordlists.sort(key=lambda x: x["modified"], reverse=True)
-        return wordlists[:limit]
+        # Newest first; only the requested number are kept, not a full sort
+        recent = heapq.nlargest(limit, files, key=lambda item: item[1].st_mtime)
+        return [{
+            "filename": entry.name,
+            "path": entry.path,
+            "size": stats.st_size,
+            "created": datetime.fromtimestamp(stats.st_ctime),
+            "modified": datetime.fromtimestamp(stats.st_mtime)
+        } for entry, stats in recent]
     
     @staticmethod
     def get_word_count(filepath: str) -> int:
         """Count words in a file"""
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                return sum(1 for _ in f)
+            count = 0
+            last = b'\n'
+            # Count newlines in 1 MiB binary blocks; no per-line decoding
+            with open(filepath, 'rb') as f:
+                for block in iter(lambda: f.read(1 << 20), b''):
+                    count += block.count(b'\n')
+                    last = block[-1:]
+            # A final word without a trailing newline still counts
+            return count + (last != b'\n')
         except:
             return 0
\ No newline at end of file
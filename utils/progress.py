@@ -1,24 +1,35 @@
 import time
 from typing import Callable, Dict, Any
-import streamlit as st
 
 class ProgressNotifier:
     """Advanced progress notification system"""
     
+    UPDATE_INTERVAL = 0.05  # Seconds between recomputed progress messages
+    
     def __init__(self, total_steps: int = 100):
         self.total_steps = total_steps
         self.current_step = 0
-        self.start_time = time.time()
+        self.start_time = time.perf_counter()  # Monotonic, unaffected by clock changes
         self.last_update_time = self.start_time
         self.phase = "Initializing"
+        self._last_update = None  # (progress, message) from the last recomputation
+        self._last_phase = None  # Phase that message was built for
         
     def update_progress(self, step: int, phase: str, details: Dict[str, Any] = None):
         """Update progress with detailed information"""
         self.current_step = step
         self.phase = phase
         
+        # Frequent callers get the previous result until UPDATE_INTERVAL has passed;
+        # phase changes and the final step are always reported fresh
+        current_time = time.perf_counter()
+        if (self._last_update is not None and step < self.total_steps
+                and phase == self._last_phase
+                and current_time - self.last_update_time < self.UPDATE_INTERVAL):
+            return self._last_update
+        self.last_update_time = current_time
+        
         progress = min(step / self.total_steps, 1.0)
-        current_time = time.time()
         elapsed = current_time - self.start_time
         
         # Calculate ETA
@@ -37,7 +48,9 @@ class ProgressNotifier:
         if eta > 0:
             message += f" | ETA: {self._format_time(eta)}"
         
-        return progress, message
+        self._last_update = (progress, message)
+        self._last_phase = phase
+        return self._last_update
     
     def _format_details(self, details: Dict[str, Any]) -> str:
         """Format details for display"""
@@ -60,7 +73,7 @@ class ProgressNotifier:
     
     def complete(self):
         """Mark progress as complete"""
-        total_time = time.time() - self.start_time
+        total_time = time.perf_counter() - self.start_time
         return f"✅ Completed in {self._format_time(total_time)}"
 
 class StreamlitProgressManager:
@@ -73,6 +86,8 @@ class StreamlitProgressManager:
         
     def initialize_display(self):
         """Initialize progress display elements"""
+        import streamlit as st  # Deferred so ProgressNotifier users don't load Streamlit
+        
         self.progress_bar = st.progress(0)
         self.status_text = st.empty()
         self.details_text = st.empty()